@@ -0,0 +1,173 @@
+"""
+Precompute log-mel spectrograms for downloaded trailer audio.
+
+Decodes every <audio_dir>/<imdb_id>.opus once with ffmpeg, computes log-mel
+features in a process pool and appends them to a float16 store:
+
+    <out_dir>/features.f16     all spectrograms back to back, (frames, n_mels) each
+    <out_dir>/manifest.json    feature config plus, per IMDb ID, the frame offset,
+                               frame count and the source file's size and mtime
+
+Runs are incremental: only audio files that are new or changed since the
+last run are featurized.
+
+    python audio_features.py data_crime/audios data_crime/audio_features --workers 8
+"""
+import os
+import json
+import time
+import argparse
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+FEATURE_CONFIG = {
+    "sample_rate": 16000,
+    "n_fft": 400,          # 25 ms windows
+    "hop_length": 160,     # 10 ms hop
+    "n_mels": 64,
+    "fmin": 0.0,
+    "fmax": 8000.0,
+}
+
+FEATURES_FILE = "features.f16"
+MANIFEST_FILE = "manifest.json"
+
+
+def decode_audio(path, sample_rate):
+    """Decode an audio file to mono float32 samples with ffmpeg."""
+    result = subprocess.run(
+        ['ffmpeg', '-loglevel', 'error', '-i', path, '-f', 'f32le', '-ac', '1', '-ar', str(sample_rate), '-'],
+        check=True, capture_output=True,
+    )
+    return np.frombuffer(result.stdout, dtype=np.float32)
+
+def mel_filterbank(config):
+    """(n_mels, n_fft // 2 + 1) triangular mel filters (HTK mel scale)."""
+    n_freqs = config["n_fft"] // 2 + 1
+    to_mel = lambda f: 2595.0 * np.log10(1.0 + f / 700.0)
+    to_hz = lambda m: 700.0 * (10.0 ** (m / 2595.0) - 1.0)
+    mel_points = np.linspace(to_mel(config["fmin"]), to_mel(config["fmax"]), config["n_mels"] + 2)
+    hz_points = to_hz(mel_points)
+    freqs = np.linspace(0, config["sample_rate"] / 2, n_freqs)
+    lower, center, upper = hz_points[:-2, None], hz_points[1:-1, None], hz_points[2:, None]
+    rising = (freqs - lower) / (center - lower)
+    falling = (upper - freqs) / (upper - center)
+    return np.maximum(0.0, np.minimum(rising, falling)).astype(np.float32)
+
+def log_mel(samples, config, filterbank=None):
+    """Log-mel spectrogram of mono samples, shape (frames, n_mels)."""
+    n_fft, hop = config["n_fft"], config["hop_length"]
+    if len(samples) < n_fft:
+        samples = np.pad(samples, (0, n_fft - len(samples)))
+    frames = np.lib.stride_tricks.sliding_window_view(samples, n_fft)[::hop]
+    power = np.abs(np.fft.rfft(frames * np.hanning(n_fft).astype(np.float32), axis=1)) ** 2
+    filterbank = mel_filterbank(config) if filterbank is None else filterbank
+    return np.log(power @ filterbank.T + 1e-6).astype(np.float16)
+
+def featurize(imdb_id, path, config):
+    """Worker: decode one file and return (imdb_id, features, size, mtime), or features None on error."""
+    stat = os.stat(path)
+    try:
+        features = log_mel(decode_audio(path, config["sample_rate"]), config)
+    except Exception as e:
+        print(f"Error featurizing {imdb_id}: {e}")
+        features = None
+    return imdb_id, features, stat.st_size, stat.st_mtime
+
+
+class AudioFeatureStore:
+    """Incremental float16 log-mel store with a JSON manifest (see the module docstring)."""
+
+    def __init__(self, path, config=FEATURE_CONFIG):
+        self.path = path
+        self.config = dict(config)
+        os.makedirs(path, exist_ok=True)
+        self.features_path = os.path.join(path, FEATURES_FILE)
+        self.manifest_path = os.path.join(path, MANIFEST_FILE)
+        self.entries = {}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+            # Features made with another config can't be mixed in; start the store over
+            if manifest["config"] == self.config:
+                self.entries = manifest["entries"]
+        if not self.entries and os.path.exists(self.features_path):
+            os.remove(self.features_path)
+        self._features = None
+
+    def pending(self, audio_dir):
+        """(imdb_id, path) of every .opus file that is new or changed since it was featurized."""
+        todo = []
+        for name in sorted(os.listdir(audio_dir)):
+            if not name.endswith(".opus"):
+                continue
+            imdb_id, path = name[:-len(".opus")], os.path.join(audio_dir, name)
+            stat = os.stat(path)
+            entry = self.entries.get(imdb_id)
+            if entry is None or entry["size"] != stat.st_size or entry["mtime"] != stat.st_mtime:
+                todo.append((imdb_id, path))
+        return todo
+
+    def update(self, audio_dir, workers=None):
+        """Featurize new or changed audio files across a process pool; returns the number processed."""
+        todo = self.pending(audio_dir)
+        if not todo:
+            print(f"Audio features up to date ({len(self.entries)} files)")
+            return 0
+
+        n_mels = self.config["n_mels"]
+        offset = os.path.getsize(self.features_path) // (2 * n_mels) if os.path.exists(self.features_path) else 0
+        start, done = time.perf_counter(), 0
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor, \
+                open(self.features_path, "ab") as out:
+            ids, paths = zip(*todo)
+            for imdb_id, features, size, mtime in executor.map(
+                    featurize, ids, paths, [self.config] * len(todo), chunksize=4):
+                if features is None:
+                    continue
+                # Changed files are appended again; their old frames are left unreferenced
+                out.write(features.tobytes())
+                self.entries[imdb_id] = {"offset": offset, "frames": len(features), "size": size, "mtime": mtime}
+                offset += len(features)
+                done += 1
+        self.save_manifest()
+        self._features = None
+
+        elapsed = time.perf_counter() - start
+        print(f"Featurized {done}/{len(todo)} audio files in {elapsed:.1f}s "
+              f"({done / elapsed if elapsed else 0.0:.1f} files/s)")
+        return done
+
+    def save_manifest(self):
+        partial = self.manifest_path + ".part"
+        with open(partial, "w", encoding="utf-8") as f:
+            json.dump({"config": self.config, "entries": self.entries}, f)
+        os.replace(partial, self.manifest_path)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, imdb_id):
+        return imdb_id in self.entries
+
+    def __getitem__(self, imdb_id):
+        """Log-mel features of one movie as a zero-copy (frames, n_mels) float16 view."""
+        if self._features is None:
+            self._features = np.memmap(self.features_path, dtype=np.float16, mode="r").reshape(
+                -1, self.config["n_mels"])
+        entry = self.entries[imdb_id]
+        return self._features[entry["offset"]:entry["offset"] + entry["frames"]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("audio_dir")
+    parser.add_argument("out_dir")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    AudioFeatureStore(args.out_dir).update(args.audio_dir, args.workers)
+
+
+if __name__ == "__main__":
+    main()
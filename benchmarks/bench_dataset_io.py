@@ -0,0 +1,83 @@
+"""
+Compare load time and file size of the CSV dataset against Parquet.
+
+The "legacy CSV" load is ver2.py's original path: read_csv, to_dict by index,
+then ast.literal_eval on every Genre string.
+
+    python -m benchmarks.bench_dataset_io --rows 10000 100000
+"""
+import argparse
+import ast
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from dataset_io import load_dataset, save_dataset
+
+
+def synthetic_dataset(n_rows, seed=0):
+    """Build a dataset frame shaped like ver2.py's output."""
+    rng = np.random.default_rng(seed)
+    n_genres = rng.integers(1, 4, n_rows)
+    return pd.DataFrame({
+        "Genre": [sorted(rng.choice(26, k, replace=False).tolist()) for k in n_genres],
+        "Title": [f"Movie {i}" for i in range(n_rows)],
+        "Runtime (min)": rng.integers(60, 200, n_rows),
+        "IMDb Score": np.round(rng.uniform(1, 10, n_rows), 1),
+        "Votes": rng.integers(5, 3_000_000, n_rows),
+        "IMDb ID": [f"tt{i:07d}" for i in range(n_rows)],
+        "Poster URL": [f"https://m.media-amazon.com/images/M/MV5B{i}._V1_QL75_UX140_CR0,1,140,207_.jpg"
+                       for i in range(n_rows)],
+    })
+
+
+def legacy_csv_load(path):
+    """ver2.py's original reload: read_csv, to_dict, then literal_eval per row."""
+    existing_dict = pd.read_csv(path).to_dict(orient="index")
+    return {row["IMDb ID"]: dict(row, Genre=ast.literal_eval(row["Genre"])) for row in existing_dict.values()}
+
+
+def best_time(fn, *args, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def size_of(path):
+    if os.path.isdir(path):
+        return sum(os.path.getsize(os.path.join(root, name))
+                   for root, _, names in os.walk(path) for name in names)
+    return os.path.getsize(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_rows in args.rows:
+            df = synthetic_dataset(n_rows)
+            csv_path = os.path.join(tmp, f"data_{n_rows}.csv")
+            parquet_path = os.path.join(tmp, f"data_{n_rows}.parquet")
+            df.to_csv(csv_path, index=False, encoding="utf-8")
+            save_dataset(df, parquet_path)
+
+            results = [
+                ("legacy CSV (literal_eval)", legacy_csv_load, csv_path),
+                ("load_dataset CSV", load_dataset, csv_path),
+                ("load_dataset Parquet", load_dataset, parquet_path),
+            ]
+            print(f"[{n_rows} rows]")
+            for name, fn, path in results:
+                print(f"  {name:<28} {best_time(fn, path) * 1000:8.1f} ms   {size_of(path) / 1e6:7.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
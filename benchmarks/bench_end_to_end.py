@@ -0,0 +1,148 @@
+"""
+Offline end-to-end benchmark of the ver2 pipeline.
+
+Everything ver2.py talks to is replaced by a local stand-in: IMDb search
+pages come from fixture_server (the pagination fixture in headless Chrome),
+TMDb from tmdb_stub, and yt-dlp by a fake download that copies a fixture
+audio file after a configurable delay. Each size runs ver2.run() itself
+(crawl, dedupe against the existing dataset, journal, media pipeline with a
+real ffmpeg transcode, media store, poster fetch, save and metrics file) in
+a fresh process with its own temporary data folder, then reports movies per
+second, that process's peak RSS and p50/p95/total time per stage from
+run_metrics.
+
+Needs Chrome, ffmpeg and ffprobe.
+
+    python -m benchmarks.bench_end_to_end --sizes 100 500 2000 --genres 2
+"""
+import argparse
+import contextlib
+import math
+import multiprocessing
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import browser_pool
+import media_pipeline
+import ver2
+from run_metrics import metrics
+
+from benchmarks.fixture_server import FixtureServer
+from benchmarks.tmdb_stub import TMDbStub
+
+GENRES = ["action", "adventure", "animation", "biography", "comedy", "crime", "documentary", "drama"]
+
+
+def make_fixture_media(root, seconds=30):
+    """A short opus trailer soundtrack and a poster-sized JPEG, made with ffmpeg."""
+    audio = os.path.join(root, "trailer.webm")
+    poster = os.path.join(root, "poster.jpg")
+    subprocess.run(['ffmpeg', '-y', '-loglevel', 'error', '-f', 'lavfi', '-i', f'sine=frequency=440:duration={seconds}',
+                    '-c:a', 'libopus', '-b:a', '96k', audio], check=True)
+    subprocess.run(['ffmpeg', '-y', '-loglevel', 'error', '-f', 'lavfi', '-i', 'testsrc=size=300x444',
+                    '-frames:v', '1', poster], check=True)
+    with open(poster, "rb") as f:
+        return audio, f.read()
+
+
+def fake_download(fixture_audio, latency):
+    """Stand-in for media_pipeline.download_trailer_audio that copies the fixture audio."""
+    def download(trailer_url, output_dir, imdb_id, download_options=None):
+        time.sleep(latency)
+        os.makedirs(output_dir, exist_ok=True)
+        path = os.path.join(output_dir, f"{imdb_id}.source.webm")
+        shutil.copyfile(fixture_audio, path)
+        return path
+    return download
+
+
+def peak_rss_mb():
+    """Peak RSS of this process and of its largest finished child (Chrome, ffmpeg), in MB, over its lifetime."""
+    if resource is None:
+        return float("nan"), float("nan")
+    scale = 1 if sys.platform == "darwin" else 1024  # ru_maxrss is bytes on macOS, KiB on Linux
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 1e6
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale / 1e6
+    return own, children
+
+
+def run_size(n_titles, genres, search_url, tmdb_url, fixture_audio, args):
+    """Run ver2 once against the stand-ins; called in a fresh process so peak RSS is per size."""
+    browser_pool.SEARCH_URL = search_url
+    media_pipeline.download_trailer_audio = fake_download(fixture_audio, args.download_latency)
+    workdir = tempfile.mkdtemp()
+    try:
+        config = dict(
+            ver2.default_config(),
+            TMDB_API_TOKEN="Bearer offline",
+            tmdb_base_url=tmdb_url,
+            genres=genres,
+            range_movies=math.ceil(n_titles / 50),
+            browser_workers=args.browser_workers,
+            headless=True,
+            extraction_mode=args.extraction_mode,
+            pipeline_workers={"lookup": 8, "download": args.download_workers, "transcode": args.transcode_workers,
+                              "poster": 4},
+            data_root=workdir,
+            trailer_cache_path=os.path.join(workdir, "trailer_cache.sqlite"),
+            poster_validators_path=os.path.join(workdir, "poster_validators.sqlite"),
+        )
+        start = time.perf_counter()
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(sys.stdout if args.verbose else devnull):
+            result = ver2.run(config)
+        elapsed = time.perf_counter() - start
+        return result, elapsed, metrics.summary(), peak_rss_mb()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 2000], help="titles per genre")
+    parser.add_argument("--genres", type=int, default=2)
+    parser.add_argument("--overlap", type=int, default=10, help="titles each genre shares with the previous one")
+    parser.add_argument("--browser-workers", type=int, default=2)
+    parser.add_argument("--extraction-mode", default="page_source")
+    parser.add_argument("--download-workers", type=int, default=4)
+    parser.add_argument("--transcode-workers", type=int, default=2)
+    parser.add_argument("--download-latency", type=float, default=0.2, help="seconds per fake trailer download")
+    parser.add_argument("--tmdb-latency", type=float, default=0.05)
+    parser.add_argument("--verbose", action="store_true", help="show ver2's own output")
+    args = parser.parse_args()
+
+    media_dir = tempfile.mkdtemp()
+    try:
+        fixture_audio, poster_bytes = make_fixture_media(media_dir)
+        genres = dict(enumerate(GENRES[:args.genres]))
+
+        with FixtureServer(poster_bytes, overlap=args.overlap) as imdb, TMDbStub(latency=args.tmdb_latency) as stub:
+            for n_titles in args.sizes:
+                imdb.total = n_titles
+                with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+                    result, elapsed, summary, (own_rss, child_rss) = executor.submit(
+                        run_size, n_titles, genres, imdb.search_url, stub.base_url, fixture_audio, args).result()
+                crawled = summary["stages"].get("crawl", {}).get("total", 0.0)
+                scraped, kept = result["scraped"], result["saved"]
+                print(f"[{n_titles} titles x {len(genres)} genres] {scraped} movies scraped, {kept} kept "
+                      f"in {elapsed:.1f}s (crawl {crawled:.1f}s): {kept / elapsed:.2f} movies/s, "
+                      f"{scraped / crawled if crawled else 0.0:.1f} scraped/s; peak RSS {own_rss:.0f} MB "
+                      f"(largest child {child_rss:.0f} MB)")
+                for stage, t in sorted(summary["stages"].items(), key=lambda item: -item[1]["total"]):
+                    print(f"  {stage:<18} calls={t['calls']:<6} p50={t['p50']:.3f}s p95={t['p95']:.3f}s "
+                          f"total={t['total']:.1f}s")
+    finally:
+        shutil.rmtree(media_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Time frame_sampler.sample_trailers on local video files.
+
+Samples every file once with a single worker and once with a process pool,
+and, when the video_sampler CLI is installed, once through one `video_sampler
+hash` subprocess per file as ver1.py used to. Without --videos, synthetic
+clips of moving shapes are written with OpenCV first.
+
+    python -m benchmarks.bench_frame_sampler --videos trailer1.mp4 trailer2.mp4
+    python -m benchmarks.bench_frame_sampler --synthetic 8 --seconds 60
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+from frame_sampler import sample_trailers
+
+
+def write_synthetic_video(path, seconds, fps=24, size=(640, 360), seed=0):
+    """A clip of drifting rectangles that changes scene every few seconds."""
+    rng = np.random.default_rng(seed)
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), fps, size)
+    for i in range(int(seconds * fps)):
+        if i % (fps * 3) == 0:
+            color = rng.integers(0, 255, 3).tolist()
+            background = rng.integers(0, 255, 3).tolist()
+        frame = np.full((size[1], size[0], 3), background, dtype=np.uint8)
+        x = (i * 4) % size[0]
+        cv2.rectangle(frame, (x, 60), (x + 120, 240), color, -1)
+        writer.write(frame)
+    writer.release()
+
+
+def time_sampler(videos, workers, hash_size, buffer_size):
+    out = tempfile.mkdtemp()
+    try:
+        start = time.perf_counter()
+        counts = sample_trailers(videos, out, workers=workers, hash_size=hash_size, buffer_size=buffer_size)
+        return time.perf_counter() - start, sum(counts.values())
+    finally:
+        shutil.rmtree(out, ignore_errors=True)
+
+
+def time_subprocess(videos, hash_size, buffer_size):
+    out = tempfile.mkdtemp()
+    try:
+        start = time.perf_counter()
+        for path in videos.values():
+            subprocess.run(["video_sampler", "hash", path, out, "--hash-size", str(hash_size),
+                            "--buffer-size", str(buffer_size)], check=True, capture_output=True)
+        return time.perf_counter() - start, len(os.listdir(out))
+    finally:
+        shutil.rmtree(out, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--videos", nargs="*", default=[])
+    parser.add_argument("--synthetic", type=int, default=4, help="clips to generate when no --videos are given")
+    parser.add_argument("--seconds", type=float, default=30)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--hash-size", type=int, default=3)
+    parser.add_argument("--buffer-size", type=int, default=20)
+    args = parser.parse_args()
+
+    tmp = None
+    videos = {f"tt{i:07d}": path for i, path in enumerate(args.videos)}
+    if not videos:
+        tmp = tempfile.mkdtemp()
+        for i in range(args.synthetic):
+            path = os.path.join(tmp, f"clip{i}.mp4")
+            write_synthetic_video(path, args.seconds, seed=i)
+            videos[f"tt{i:07d}"] = path
+    try:
+        print(f"{len(videos)} videos")
+        for label, workers in [("1 worker", 1), (f"{args.workers} workers", args.workers)]:
+            elapsed, frames = time_sampler(videos, workers, args.hash_size, args.buffer_size)
+            print(f"  {label:<14} {elapsed:7.2f}s  {frames} frames")
+        if shutil.which("video_sampler"):
+            elapsed, frames = time_subprocess(videos, args.hash_size, args.buffer_size)
+            print(f"  {'video_sampler':<14} {elapsed:7.2f}s  {frames} frames")
+        else:
+            print("  video_sampler not installed, skipping subprocess baseline")
+    finally:
+        if tmp:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Memory per record and upsert throughput of movie_store.MovieStore.
+
+Builds N synthetic result cards, then measures the traced memory of a
+MovieStore holding them against the plain dict-of-dicts ver2.py used, and
+times inserting every card and then re-upserting all of them with a second
+genre. The old ver1.py list scan is timed on a small sample for reference.
+
+    python -m benchmarks.bench_movie_store --records 1000000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from movie_store import MovieStore
+
+
+def synthetic_cards(n):
+    return [{
+        "Title": f"Synthetic Movie {i}",
+        "Runtime (min)": 80 + i % 90,
+        "IMDb Score": round(5 + (i % 50) / 10, 1),
+        "Votes": 1000 + i,
+        "IMDb ID": f"tt{i:08d}",
+        "Poster URL": f"https://m.media-amazon.com/images/M/MV5B{i:08d}._V1_.jpg",
+    } for i in range(n)]
+
+
+def traced(build):
+    """Return (result, bytes allocated while building it)."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def dict_of_dicts(cards):
+    """The previous ver2.py layout: IMDb ID -> plain dict with a Genre list."""
+    data = {}
+    for card in cards:
+        data[card["IMDb ID"]] = dict(card, Genre=[5])
+    return data
+
+
+def movie_store(cards):
+    store = MovieStore()
+    store.add_cards(cards, 1 << 5)
+    return store
+
+
+def list_scan(cards):
+    """The previous ver1.py dedupe: a linear scan of the genre's list per card."""
+    genre_data = []
+    for card in cards:
+        existing_movie = next((movie for movie in genre_data if movie["IMDb ID"] == card["IMDb ID"]), None)
+        if existing_movie is None:
+            genre_data.append(dict(card, Genre=[5]))
+    return genre_data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--scan-records", type=int, default=5_000)
+    args = parser.parse_args()
+
+    # Card strings are shared by both layouts, so only per-record overhead is measured
+    cards = synthetic_cards(args.records)
+    n = args.records
+
+    _, dict_bytes = traced(lambda: dict_of_dicts(cards))
+    _, store_bytes = traced(lambda: movie_store(cards))
+    print(f"[{n} records]")
+    print(f"  dict of dicts  {dict_bytes / n:7.1f} bytes/record")
+    print(f"  MovieStore     {store_bytes / n:7.1f} bytes/record")
+
+    store = MovieStore()
+    start = time.perf_counter()
+    store.add_cards(cards, 1 << 5)
+    insert = time.perf_counter() - start
+    start = time.perf_counter()
+    store.add_cards(cards, 1 << 7)
+    merge = time.perf_counter() - start
+    print(f"  insert {n / insert:12,.0f} upserts/s   genre merge {n / merge:12,.0f} upserts/s")
+
+    sample = cards[:args.scan_records]
+    start = time.perf_counter()
+    list_scan(sample)
+    scan = time.perf_counter() - start
+    print(f"  ver1 list scan on {len(sample)} records: {len(sample) / scan:12,.0f} cards/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Compare page_source extraction against the per-element WebDriver loop.
+
+Builds a search page with N result cards from the saved fixture, then times
+parse_result_cards on the raw HTML and, when Chrome is available, both
+extraction modes against the same page loaded in a headless browser.
+
+    python -m benchmarks.bench_page_source --cards 50 1000
+"""
+import argparse
+import os
+import re
+import tempfile
+import time
+
+from imdb_parsing import parse_result_cards, extract_cards_from_elements, extract_cards_from_page_source
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), "fixtures", "imdb_search_page.html")
+
+
+def build_page(n_cards):
+    """Repeat the fixture's result cards until the page holds n_cards of them."""
+    with open(FIXTURE_PATH, encoding="utf-8") as f:
+        page = f.read()
+    matches = list(re.finditer(r'<li class="ipc-metadata-list-summary-item">.*?</li>', page, re.S))
+    templates = [m.group(0) for m in matches]
+    head, tail = page[:matches[0].start()], page[matches[-1].end():]
+
+    cards = []
+    for i in range(n_cards):
+        card = templates[i % len(templates)]
+        # Give every copy a unique IMDb ID and rank so the records stay distinct
+        card = re.sub(r'/title/tt\d+/', f'/title/tt{9000000 + i}/', card)
+        card = re.sub(r'>\d+\. ', f'>{i + 1}. ', card)
+        cards.append(card)
+    return head + "\n".join(cards) + tail
+
+
+def time_call(fn, *args, repeat=3):
+    """Return the best wall time of repeat calls and the last result."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def make_driver():
+    """Start a headless Chrome, or return None if it is not available."""
+    try:
+        from selenium import webdriver
+        options = webdriver.ChromeOptions()
+        options.add_argument("--headless=new")
+        return webdriver.Chrome(options=options)
+    except Exception as e:
+        print(f"Chrome not available, skipping browser comparison: {e}")
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cards", type=int, nargs="+", default=[50, 500, 1000])
+    parser.add_argument("--no-browser", action="store_true", help="only time the in-process parser")
+    args = parser.parse_args()
+
+    driver = None if args.no_browser else make_driver()
+    try:
+        for n_cards in args.cards:
+            page = build_page(n_cards)
+            parse_time, _ = time_call(parse_result_cards, page)
+            print(f"[{n_cards} cards] parse_result_cards on raw HTML: {parse_time * 1000:.1f} ms")
+
+            if driver is None:
+                continue
+
+            with tempfile.NamedTemporaryFile("w", suffix=".html", delete=False, encoding="utf-8") as f:
+                f.write(page)
+            try:
+                driver.get("file://" + f.name)
+                page_time, page_cards = time_call(extract_cards_from_page_source, driver)
+                element_time, element_cards = time_call(extract_cards_from_elements, driver, repeat=1)
+            finally:
+                os.remove(f.name)
+
+            mismatches = sum(1 for a, b in zip(page_cards, element_cards) if a != b)
+            mismatches += abs(len(page_cards) - len(element_cards))
+            print(f"[{n_cards} cards] page_source: {page_time * 1000:.1f} ms, "
+                  f"elements: {element_time * 1000:.1f} ms, "
+                  f"speedup: {element_time / page_time:.1f}x, mismatched records: {mismatches}")
+    finally:
+        if driver is not None:
+            driver.quit()
+
+
+if __name__ == "__main__":
+    main()
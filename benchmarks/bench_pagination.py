@@ -0,0 +1,71 @@
+"""
+Compare the fixed-sleep "show more" loop with pagination.paginate.
+
+Both run in headless Chrome against a local fixture page that appends result
+cards after a random delay on every click.
+
+    python -m benchmarks.bench_pagination --clicks 9 --delay 400 --jitter 400
+"""
+import argparse
+import os
+import re
+import time
+
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from pagination import paginate, count_results
+
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "imdb_pagination.html")
+
+
+def fixed_sleep_loop(driver, clicks):
+    """The original ver2.py loop: sleep 3s, then click and sleep 1s per page."""
+    time.sleep(3)
+    for i in range(clicks):
+        try:
+            buttons = WebDriverWait(driver, 10).until(
+                EC.presence_of_all_elements_located((By.XPATH, "//span[contains(text(), ' more')]"))
+            )
+            for button in buttons:
+                if re.search(r'\d+', button.text):
+                    driver.execute_script("arguments[0].click();", button)
+                    break
+            time.sleep(1)
+        except Exception:
+            break
+
+
+def run(driver, url, label, fn, *args):
+    driver.get(url)
+    start = time.perf_counter()
+    fn(driver, *args)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<12} {elapsed:6.2f}s  {count_results(driver)} results loaded")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clicks", type=int, default=9)
+    parser.add_argument("--total", type=int, default=500)
+    parser.add_argument("--delay", type=int, default=400, help="ms before each batch appears")
+    parser.add_argument("--jitter", type=int, default=400, help="extra random ms per batch")
+    args = parser.parse_args()
+
+    url = f"file://{FIXTURE_PATH}?total={args.total}&delay={args.delay}&jitter={args.jitter}"
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    driver = webdriver.Chrome(options=options)
+    try:
+        legacy = run(driver, url, "fixed sleeps", fixed_sleep_loop, args.clicks)
+        evented = run(driver, url, "paginate", paginate, args.clicks)
+        print(f"saved {legacy - evented:.2f}s ({legacy / evented:.1f}x faster)")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
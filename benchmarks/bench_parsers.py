@@ -0,0 +1,92 @@
+"""
+Time the batch parsers against the scalar ones.
+
+Inputs are random raw strings: realistic card text, 10% missing values and
+a --junk fraction of garbage (unicode digits, signs, stray punctuation).
+That the batch and scalar parsers agree is checked in tests/test_imdb_parsing.py.
+
+    python -m benchmarks.bench_parsers --rows 10000 1000000 --junk 0.01
+"""
+import argparse
+import random
+import time
+
+from imdb_parsing import (parse_runtime, parse_votes, parse_imdb_score,
+                          parse_runtime_batch, parse_votes_batch, parse_imdb_score_batch)
+
+JUNK = ["", " ", ".", "K", "M", "h", "m", "-", "+", "١", "٢", "²", "_", "(", ")", ",", "e", "x", " "]
+
+
+def random_runtime(rng, junk):
+    kind = rng.random()
+    if kind >= junk + 0.1:
+        return rng.choice([f"{rng.randint(1, 3)}h {rng.randint(0, 59)}m", f"{rng.randint(1, 59)}m",
+                           f"{rng.randint(1, 4)}h", f"{rng.randint(1900, 2025)}"])
+    if kind >= junk:
+        return None
+    return "".join(rng.choice(JUNK + ["1", "2", "0"]) for _ in range(rng.randint(0, 6)))
+
+
+def random_votes(rng, junk):
+    kind = rng.random()
+    if kind >= junk + 0.1:
+        return rng.choice([f"({rng.randint(1, 999)}K)", f" ({rng.randint(1, 9)}.{rng.randint(0, 9)}M)",
+                           f"{rng.randint(5, 999):,}", f"({rng.randint(1000, 999999):,})",
+                           f"{rng.randint(1, 999)}.{rng.randint(0, 99)}K"])
+    if kind >= junk:
+        return None
+    return "".join(rng.choice(JUNK + ["1", "5", "9", "."]) for _ in range(rng.randint(0, 7)))
+
+
+def random_score(rng, junk):
+    kind = rng.random()
+    if kind >= junk + 0.1:
+        return rng.choice([f"{rng.randint(1, 9)}.{rng.randint(0, 9)}", f"{rng.randint(1, 10)}", "10.0"])
+    if kind >= junk:
+        return None
+    return "".join(rng.choice(JUNK + ["1", "7", "."]) for _ in range(rng.randint(0, 5)))
+
+
+def scalar_votes(value):
+    # Junk like '9e999K' makes parse_votes raise OverflowError (the batch parser gives <NA>)
+    try:
+        return parse_votes(value)
+    except OverflowError:
+        return None
+
+
+CASES = [
+    ("runtime", random_runtime, lambda v: parse_runtime(v) if v else None, parse_runtime_batch),
+    ("votes", random_votes, scalar_votes, parse_votes_batch),
+    ("score", random_score, lambda v: parse_imdb_score(v) if v else None, parse_imdb_score_batch),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 1_000_000])
+    parser.add_argument("--junk", type=float, default=0.01, help="fraction of garbage strings")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    # The first pyarrow compute call pays a one-time setup cost; keep it out of the timings
+    for name, generate, scalar, batch in CASES:
+        batch([generate(rng, args.junk) for _ in range(100)])
+
+    for n_rows in args.rows:
+        print(f"[{n_rows} rows]")
+        for name, generate, scalar, batch in CASES:
+            values = [generate(rng, args.junk) for _ in range(n_rows)]
+            start = time.perf_counter()
+            [scalar(v) for v in values]
+            scalar_time = time.perf_counter() - start
+            start = time.perf_counter()
+            batch(values)
+            batch_time = time.perf_counter() - start
+            print(f"  {name:<8} scalar {scalar_time * 1000:9.1f} ms   batch {batch_time * 1000:9.1f} ms   "
+                  f"({scalar_time / batch_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Random-access read throughput: packed shards vs. loose .opus/.jpg files.
+
+Writes N synthetic items (a JPEG poster and a random-bytes "opus" file each)
+as loose files, packs them with dataset_shards.export_shards, then reads the
+items in random order both ways. Loose reads open, read and decode every
+file; shard reads index by IMDb ID into memory-mapped shards.
+
+    python -m benchmarks.bench_shards --items 5000 --reads 20000
+"""
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+from dataset_shards import POSTER_SHAPE, ShardedDataset, export_shards, load_poster
+
+
+def write_loose_files(root, n_items, audio_bytes, seed=0):
+    rng = np.random.default_rng(seed)
+    audio_dir, poster_dir = os.path.join(root, "audios"), os.path.join(root, "posters")
+    os.makedirs(audio_dir)
+    os.makedirs(poster_dir)
+    ids = [f"tt{i:08d}" for i in range(n_items)]
+    for imdb_id in ids:
+        poster = rng.integers(0, 255, (444, 300, 3), dtype=np.uint8)
+        cv2.imwrite(os.path.join(poster_dir, f"{imdb_id}.jpg"), poster)
+        with open(os.path.join(audio_dir, f"{imdb_id}.opus"), "wb") as f:
+            f.write(rng.bytes(audio_bytes))
+    return ids, audio_dir, poster_dir
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--reads", type=int, default=20000)
+    parser.add_argument("--shard-size", type=int, default=1024)
+    parser.add_argument("--audio-kb", type=int, default=120, help="size of each synthetic audio file")
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp()
+    try:
+        ids, audio_dir, poster_dir = write_loose_files(root, args.items, args.audio_kb * 1024)
+
+        def media_paths(imdb_id):
+            return os.path.join(audio_dir, f"{imdb_id}.opus"), os.path.join(poster_dir, f"{imdb_id}.jpg")
+
+        start = time.perf_counter()
+        export_shards(ids, media_paths, os.path.join(root, "shards"), args.shard_size)
+        print(f"export: {time.perf_counter() - start:.2f}s")
+
+        order = random.Random(0).choices(ids, k=args.reads)
+
+        start = time.perf_counter()
+        checksum = 0
+        for imdb_id in order:
+            audio_file, poster_file = media_paths(imdb_id)
+            poster = load_poster(poster_file, POSTER_SHAPE)
+            with open(audio_file, "rb") as f:
+                audio = f.read()
+            checksum += int(poster[0, 0, 0]) + len(audio)
+        loose = time.perf_counter() - start
+
+        dataset = ShardedDataset(os.path.join(root, "shards"))
+        start = time.perf_counter()
+        checksum_shards = 0
+        for imdb_id in order:
+            poster, audio = dataset[imdb_id]
+            checksum_shards += int(poster[0, 0, 0]) + len(audio)
+        shards = time.perf_counter() - start
+
+        print(f"loose files  {args.reads / loose:10,.0f} items/s")
+        print(f"shards       {args.reads / shards:10,.0f} items/s  ({loose / shards:.1f}x)")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Compare streaming extraction with paginate-then-extract on long result lists.
+
+Loads the pagination fixture in headless Chrome with each --total and either
+clicks through everything before one page_source extraction, or streams the
+cards batch by batch with streaming_extraction.stream_cards. Reports total
+time, peak JS heap and DOM nodes, and for streaming the first/last batch
+extraction times, which should stay flat as the total grows.
+
+    python -m benchmarks.bench_streaming --totals 500 10000
+"""
+import argparse
+import os
+import time
+
+from selenium import webdriver
+
+from imdb_parsing import extract_cards_from_page_source
+from pagination import paginate
+from streaming_extraction import MB, StreamStats, browser_metrics, stream_cards
+
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "imdb_pagination.html")
+
+
+def paginate_then_extract(driver, clicks):
+    paginate(driver, clicks, poll=0.02)
+    heap, nodes = browser_metrics(driver)
+    return len(extract_cards_from_page_source(driver)), heap, nodes
+
+
+def streamed(driver, clicks, stats):
+    cards = sum(1 for _ in stream_cards(driver, clicks, poll=0.02, stats=stats))
+    return cards, stats.peak_heap, stats.peak_nodes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--totals", type=int, nargs="+", default=[500, 10_000])
+    parser.add_argument("--batch", type=int, default=50)
+    args = parser.parse_args()
+
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    driver = webdriver.Chrome(options=options)
+    driver.execute_cdp_cmd("Performance.enable", {})
+    try:
+        for total in args.totals:
+            url = f"file://{FIXTURE_PATH}?total={total}&batch={args.batch}&delay=0&jitter=0&load_delay=0"
+            clicks = -(-total // args.batch)
+            print(f"[{total} titles]")
+
+            driver.get(url)
+            start = time.perf_counter()
+            cards, heap, nodes = paginate_then_extract(driver, clicks)
+            elapsed = time.perf_counter() - start
+            print(f"  paginate+extract {elapsed:7.2f}s  {cards} cards  heap {heap / MB:6.1f} MB  nodes {int(nodes)}")
+
+            driver.get(url)
+            stats = StreamStats()
+            start = time.perf_counter()
+            cards, heap, nodes = streamed(driver, clicks, stats)
+            elapsed = time.perf_counter() - start
+            print(f"  stream           {elapsed:7.2f}s  {cards} cards  heap {heap / MB:6.1f} MB  nodes {int(nodes)}  "
+                  f"batch first {stats.batch_seconds[0] * 1000:.0f}ms last {stats.batch_seconds[-1] * 1000:.0f}ms")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Compare one-request-per-movie trailer lookups against TMDbClient.get_trailer_urls.
+
+Both run against the local TMDb stub, which adds a fixed latency per request
+and periodically answers with 429 to exercise the Retry-After handling.
+
+    python -m benchmarks.bench_tmdb_client --movies 200 --latency 0.05
+"""
+import argparse
+import time
+
+import requests
+
+from benchmarks.tmdb_stub import TMDbStub
+from tmdb_client import TMDbClient, pick_trailer_url
+
+
+def sequential_lookup(base_url, imdb_ids):
+    """The original get_trailer_url loop: a fresh requests.get per movie."""
+    results = {}
+    for imdb_id in imdb_ids:
+        try:
+            response = requests.get(f"{base_url}/movie/{imdb_id}/videos?language=en-US",
+                                    headers={"accept": "application/json"})
+            response.raise_for_status()
+            results[imdb_id] = pick_trailer_url(response.json())
+        except Exception:
+            results[imdb_id] = None
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--movies", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--throttle-every", type=int, default=50)
+    args = parser.parse_args()
+
+    imdb_ids = [f"tt{1000000 + i}" for i in range(args.movies)]
+
+    with TMDbStub(latency=args.latency) as stub:
+        start = time.perf_counter()
+        expected = sequential_lookup(stub.base_url, imdb_ids)
+        sequential_time = time.perf_counter() - start
+
+    with TMDbStub(latency=args.latency, throttle_every=args.throttle_every) as stub:
+        with TMDbClient("Bearer stub", base_url=stub.base_url, max_workers=args.workers) as client:
+            start = time.perf_counter()
+            results = client.get_trailer_urls(imdb_ids)
+            batch_time = time.perf_counter() - start
+        throttled = stub.throttled
+
+    mismatches = sum(1 for imdb_id in imdb_ids if results.get(imdb_id) != expected[imdb_id])
+    print(f"sequential: {sequential_time:.2f}s ({args.movies / sequential_time:.1f} movies/s)")
+    print(f"batched:    {batch_time:.2f}s ({args.movies / batch_time:.1f} movies/s), "
+          f"{throttled} responses throttled with 429")
+    print(f"speedup: {sequential_time / batch_time:.1f}x, mismatched results: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
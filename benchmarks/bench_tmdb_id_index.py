@@ -0,0 +1,93 @@
+"""
+Trailer resolution through the local IMDb -> TMDb ID index vs. direct lookups.
+
+Builds a TMDbIdIndex from the small fixture export (or, with --synthetic N,
+from a generated export of N movies), times index building and lookups, then
+resolves the same IMDb IDs against tmdb_stub with and without the index and
+reports the requests each way. IDs missing from the export are skipped by the
+indexed client without any request.
+
+    python -m benchmarks.bench_tmdb_id_index
+    python -m benchmarks.bench_tmdb_id_index --synthetic 1000000 --movies 500
+"""
+import argparse
+import gzip
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from tmdb_client import TMDbClient
+from tmdb_id_index import TMDbIdIndex
+
+from benchmarks.tmdb_stub import TMDbStub
+
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "tmdb_movie_ids.json")
+
+
+def write_synthetic_export(path, n):
+    """N export lines; one in ten has no IMDb ID."""
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        for i in range(n):
+            entry = {"adult": False, "id": i + 1, "original_title": f"Movie {i}", "popularity": 1.0, "video": False}
+            if i % 10:
+                entry["imdb_id"] = f"tt{1000000 + i:07d}"
+            f.write(json.dumps(entry) + "\n")
+
+
+def resolve(stub, imdb_ids, id_index):
+    before = stub.requests
+    start = time.perf_counter()
+    with TMDbClient("Bearer offline", base_url=stub.base_url, id_index=id_index) as client:
+        urls = client.get_trailer_urls(imdb_ids)
+    elapsed = time.perf_counter() - start
+    found = sum(1 for url in urls.values() if url)
+    return stub.requests - before, found, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--synthetic", type=int, default=0, help="generate an export of this many movies")
+    parser.add_argument("--movies", type=int, default=200, help="IMDb IDs to resolve (synthetic export only)")
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp()
+    try:
+        export = FIXTURE_PATH
+        if args.synthetic:
+            export = os.path.join(tmp, "movie_ids.json.gz")
+            write_synthetic_export(export, args.synthetic)
+
+        start = time.perf_counter()
+        index = TMDbIdIndex.from_export(export)
+        index.save(os.path.join(tmp, "index"))
+        index = TMDbIdIndex.load(os.path.join(tmp, "index"))
+        print(f"index: {len(index)} IMDb IDs built in {time.perf_counter() - start:.2f}s")
+
+        if args.synthetic:
+            rng = random.Random(0)
+            imdb_ids = [f"tt{1000000 + rng.randrange(args.synthetic * 2):07d}" for _ in range(args.movies)]
+        else:
+            imdb_ids = ["tt0111161", "tt0068646", "tt9876543", "tt30000001", "tt1234567", "tt0137523", "tt0000001"]
+
+        start = time.perf_counter()
+        for _ in range(100):
+            for imdb_id in imdb_ids:
+                index.get(imdb_id)
+        per_lookup = (time.perf_counter() - start) / (100 * len(imdb_ids))
+        print(f"lookup: {per_lookup * 1e6:.1f} us")
+
+        with TMDbStub(latency=args.latency) as stub:
+            for label, id_index in [("direct /videos", None), ("indexed", index)]:
+                requests_made, found, elapsed = resolve(stub, imdb_ids, id_index)
+                print(f"  {label:<15} {len(imdb_ids)} movies: {requests_made} requests, {found} trailers, "
+                      f"{elapsed:.2f}s")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
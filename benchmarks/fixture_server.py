@@ -0,0 +1,100 @@
+"""
+Local stand-in for IMDb's search pages and image server, for offline runs.
+
+    /search/title/?genres=<genre>&...  redirects to the pagination fixture with
+                                       `total` cards, offset per genre so each
+                                       genre lists its own titles (plus `overlap`
+                                       titles shared with the previous genre)
+    /fixtures/<file>                   files from benchmarks/fixtures
+    /posters/<anything>.jpg            the same fixture poster, with an ETag
+"""
+import hashlib
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+class FixtureServer:
+    """IMDb fixture server running on a background thread."""
+
+    def __init__(self, poster_bytes, total=500, batch=50, overlap=0, delay=0, jitter=0):
+        self.poster_bytes = poster_bytes
+        self.poster_etag = '"' + hashlib.sha1(poster_bytes).hexdigest() + '"'
+        self.total = total
+        self.batch = batch
+        self.overlap = overlap
+        self.delay = delay
+        self.jitter = jitter
+        self.genres = {}
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server.server_port}"
+
+    @property
+    def search_url(self):
+        """A browser_pool.SEARCH_URL template pointing at this server."""
+        return self.base_url + "/search/title/?title_type=feature&genres={genre}&release_date={date_range}"
+
+    def genre_offset(self, genre):
+        with self.lock:
+            index = self.genres.setdefault(genre, len(self.genres))
+        return index * (self.total - self.overlap)
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path.startswith("/search/title"):
+                    genre = parse_qs(url.query).get("genres", [""])[0]
+                    location = (f"/fixtures/imdb_pagination.html?total={server.total}&batch={server.batch}"
+                                f"&initial={server.batch}&offset={server.genre_offset(genre)}"
+                                f"&delay={server.delay}&jitter={server.jitter}&load_delay=0"
+                                f"&poster_base={server.base_url}/posters/")
+                    self._send(302, b"", "text/plain", {"Location": location})
+                elif url.path.startswith("/fixtures/"):
+                    path = os.path.join(FIXTURE_DIR, os.path.basename(url.path))
+                    if not os.path.exists(path):
+                        self._send(404, b"not found", "text/plain")
+                        return
+                    with open(path, "rb") as f:
+                        self._send(200, f.read(), "text/html; charset=utf-8")
+                elif url.path.startswith("/posters/"):
+                    if self.headers.get("If-None-Match") == server.poster_etag:
+                        self._send(304, b"", "image/jpeg", {"ETag": server.poster_etag})
+                    else:
+                        self._send(200, server.poster_bytes, "image/jpeg", {"ETag": server.poster_etag})
+                else:
+                    self._send(404, b"not found", "text/plain")
+
+            def _send(self, status, body, content_type, headers=None):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
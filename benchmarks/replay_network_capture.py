@@ -0,0 +1,76 @@
+"""
+Replay captured IMDb JSON through the network extraction path.
+
+Builds records from a saved __NEXT_DATA__ document (first page of results)
+and a saved GraphQL "show more" response, then compares them field by field
+with parse_result_cards on the HTML fixture for the same titles. Votes are
+exact counts in the JSON ("3M" on the card), so they only have to round to
+the card's value; posters are full size in the JSON and always differ.
+KNOWN_DIFFS lists the other known differences. Exits with status 1 on any
+unexpected difference.
+
+    python -m benchmarks.replay_network_capture
+"""
+import json
+import os
+import sys
+import time
+
+from imdb_parsing import parse_result_cards
+from network_capture import records_from_next_data, records_from_graphql, merge_records
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+EXPECTED_DIFFS = {"Poster URL"}
+# Cards are parsed by line position like the "elements" mode; a card without a certificate
+# (tt9876543) has its rating and vote count where the certificate would be, so only the JSON has them
+KNOWN_DIFFS = {("tt9876543", "IMDb Score"), ("tt9876543", "Votes")}
+
+
+def votes_match(count, card_votes):
+    """True if an exact vote count rounds to the card's value ("3M", "2.1M", "24K" or the plain count)."""
+    if count is None or card_votes is None:
+        return False
+    shown = {count} | {round(round(count / unit, digits) * unit) for unit in (1_000, 1_000_000) for digits in (0, 1)}
+    return card_votes in shown
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def main():
+    next_data = load_fixture("imdb_next_data.json")
+    page_source = f'<html><body><script id="__NEXT_DATA__" type="application/json">{next_data}</script></body></html>'
+    payload = json.loads(load_fixture("imdb_graphql_batch.json"))
+    html = load_fixture("imdb_search_page.html")
+
+    start = time.perf_counter()
+    records = merge_records(records_from_next_data(page_source), records_from_graphql(payload))
+    network_time = time.perf_counter() - start
+    start = time.perf_counter()
+    cards = {card["IMDb ID"]: card for card in parse_result_cards(html)}
+    html_time = time.perf_counter() - start
+    print(f"network records: {len(records)} in {network_time * 1000:.2f} ms   "
+          f"HTML cards: {len(cards)} in {html_time * 1000:.2f} ms")
+
+    unexpected = 0
+    for record in records:
+        card = cards.get(record["IMDb ID"])
+        if card is None:
+            print(f"  {record['IMDb ID']}: missing from HTML cards")
+            unexpected += 1
+            continue
+        for column, value in record.items():
+            if value != card[column]:
+                expected = (column in EXPECTED_DIFFS or (record["IMDb ID"], column) in KNOWN_DIFFS
+                            or column == "Votes" and votes_match(value, card[column]))
+                label = "expected" if expected else "MISMATCH"
+                unexpected += not expected
+                print(f"  {record['IMDb ID']} {column:<14} {label}: network {value!r}  html {card[column]!r}")
+    print("OK" if unexpected == 0 else f"{unexpected} unexpected differences")
+    return unexpected
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
@@ -0,0 +1,101 @@
+"""
+Local stand-in for the TMDb API, for benchmarks and offline runs.
+
+Serves /3/movie/<imdb_id>/videos, and /3/movie/<tmdb_id>?append_to_response=videos
+(details with the videos appended), with an optional per-request latency, and
+answers every `throttle_every`-th request with 429 + Retry-After.
+Movies whose numeric IMDb or TMDb ID is odd have no trailer.
+"""
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+VIDEOS_RE = re.compile(r'^/3/movie/(tt(\d+))/videos')
+DETAILS_RE = re.compile(r'^/3/movie/(\d+)(?:\?|$)')
+
+
+def videos_payload(imdb_id, number):
+    """Build the /videos response for one movie."""
+    results = [{"type": "Featurette", "site": "YouTube", "key": f"feat{number}"}]
+    if number % 2 == 0:
+        results.append({"type": "Trailer", "site": "YouTube", "key": f"key{number}"})
+    return {"id": imdb_id, "results": results}
+
+
+def details_payload(tmdb_id, append_videos):
+    """Build the /movie/<tmdb_id> response, with videos when they were appended."""
+    details = {"id": tmdb_id, "title": f"Stub Movie {tmdb_id}", "runtime": 100}
+    if append_videos:
+        details["videos"] = {"results": videos_payload(tmdb_id, tmdb_id)["results"]}
+    return details
+
+
+class TMDbStub:
+    """TMDb stub server running on a background thread."""
+
+    def __init__(self, latency=0.05, throttle_every=0, retry_after="0.2", payload=videos_payload):
+        self.latency = latency
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.payload = payload
+        self.requests = 0
+        self.throttled = 0
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server.server_port}/3"
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                with stub.lock:
+                    stub.requests += 1
+                    throttle = stub.throttle_every and stub.requests % stub.throttle_every == 0
+                    if throttle:
+                        stub.throttled += 1
+                if throttle:
+                    self._send(429, {"status_message": "rate limited"}, {"Retry-After": stub.retry_after})
+                    return
+
+                time.sleep(stub.latency)
+                match = VIDEOS_RE.match(self.path)
+                if match:
+                    self._send(200, stub.payload(match.group(1), int(match.group(2))))
+                    return
+                match = DETAILS_RE.match(self.path)
+                if match:
+                    self._send(200, details_payload(int(match.group(1)), "append_to_response=videos" in self.path))
+                    return
+                self._send(404, {"status_message": "not found"})
+
+            def _send(self, status, body, headers=None):
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,180 @@
+import queue
+import threading
+from selenium import webdriver
+from imdb_parsing import extract_cards
+from pagination import paginate
+from network_capture import capture_options, enable_network_capture, extract_cards_from_network
+from streaming_extraction import StreamStats, stream_cards, delta_cards
+from run_metrics import metrics
+
+SEARCH_URL = "https://www.imdb.com/search/title/?title_type=feature&genres={genre}&release_date={date_range}"
+DEFAULT_DATE_RANGE = ("2000-01-01", "2025-12-31")
+# Newest releases first, so a delta crawl sees new titles before known ones
+NEWEST_FIRST = "&sort=release_date,desc"
+
+
+def make_driver(headless=False, capture_network=False):
+    """Start a Chrome WebDriver, optionally capturing network responses and blocking page weight."""
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+    if capture_network:
+        capture_options(options)
+    driver = webdriver.Chrome(options=options)
+    if capture_network:
+        enable_network_capture(driver)
+    if not headless:
+        driver.maximize_window()
+    return driver
+
+def shard_date_range(date_range=DEFAULT_DATE_RANGE, shards=1):
+    """Split a (start, end) release-date range into `shards` consecutive year ranges."""
+    start_year, end_year = int(date_range[0][:4]), int(date_range[1][:4])
+    years = list(range(start_year, end_year + 1))
+    shards = max(1, min(shards, len(years)))
+    size, extra = divmod(len(years), shards)
+    ranges, i = [], 0
+    for shard in range(shards):
+        chunk = years[i:i + size + (1 if shard < extra else 0)]
+        i += len(chunk)
+        first = date_range[0] if chunk[0] == start_year else f"{chunk[0]}-01-01"
+        last = date_range[1] if chunk[-1] == end_year else f"{chunk[-1]}-12-31"
+        ranges.append(f"{first},{last}")
+    return ranges
+
+
+class BrowserPool:
+    """
+    N Chrome workers crawling search pages in parallel.
+
+    Each worker thread owns one driver and replaces it after
+    `pages_per_driver` page loads to cap chromedriver memory growth.
+
+    With `known_ids` (genre id -> IMDb IDs already in the dataset with that
+    genre), pages are sorted newest-first and pagination stops at the first
+    batch made up entirely of known titles.
+    """
+
+    def __init__(self, workers=1, pages_per_driver=10, headless=False, range_movies=20,
+                 pagination_timeout=10, extraction_mode="page_source", known_ids=None):
+        self.workers = workers
+        self.pages_per_driver = pages_per_driver
+        self.headless = headless
+        self.range_movies = range_movies
+        self.pagination_timeout = pagination_timeout
+        self.extraction_mode = extraction_mode
+        self.known_ids = known_ids
+
+    def crawl_page(self, driver, url, stats=None, known_ids=None):
+        """
+        Load one search page, paginate it and extract its result cards.
+
+        In "stream" mode cards are taken off the page after every click and
+        `stats` (a StreamStats) collects batch timings and peak browser memory.
+        With known_ids the page is delta-crawled (see delta_cards), which
+        always takes cards off the page batch by batch.
+        """
+        if self.extraction_mode == "network":
+            # Drop responses left over from the previous page
+            driver.get_log("performance")
+        with metrics.timer("page_load"):
+            driver.get(url)
+        if known_ids is not None:
+            with metrics.timer("delta_extract"):
+                cards = delta_cards(driver, self.range_movies, known_ids, timeout=self.pagination_timeout,
+                                    stats=stats)
+        elif self.extraction_mode == "stream":
+            with metrics.timer("stream_extract"):
+                cards = list(stream_cards(driver, self.range_movies, timeout=self.pagination_timeout, stats=stats))
+        else:
+            with metrics.timer("paginate"):
+                paginate(driver, self.range_movies, timeout=self.pagination_timeout)
+            with metrics.timer("extract", mode=self.extraction_mode):
+                if self.extraction_mode == "network":
+                    cards = extract_cards_from_network(driver)
+                else:
+                    cards = extract_cards(driver, self.extraction_mode)
+        metrics.count("extract", "cards", len(cards))
+        return cards
+
+    def _worker(self, tasks, results):
+        driver, pages = None, 0
+        try:
+            while True:
+                task = tasks.get()
+                if task is None:
+                    return
+                cards, stats = None, None
+                for attempt in range(2):
+                    try:
+                        if driver is None or pages >= self.pages_per_driver:
+                            if driver is not None:
+                                driver.quit()
+                            driver = None
+                            driver, pages = make_driver(self.headless, self.extraction_mode == "network"), 0
+                        pages += 1
+                        stats = StreamStats() if self.extraction_mode == "stream" else None
+                        known_ids = None if self.known_ids is None else self.known_ids.get(task["genre_id"], set())
+                        cards = self.crawl_page(driver, task["url"], stats, known_ids)
+                        break
+                    except Exception as e:
+                        print(f"Error crawling {task['url']} (attempt {attempt + 1}): {e}")
+                        metrics.count("crawl_page", "error")
+                        # Start over with a fresh browser on the retry
+                        if driver is not None:
+                            try:
+                                driver.quit()
+                            except Exception:
+                                pass
+                        driver = None
+                results.put((task, cards, stats))
+        finally:
+            if driver is not None:
+                driver.quit()
+
+    def crawl_genres(self, genres, date_range=DEFAULT_DATE_RANGE, shards=1):
+        """
+        Crawl every genre (split into `shards` release-date ranges) across the pool.
+
+        Yields (genre_id, genre, cards, complete) as each genre's shards finish;
+        complete is False if any shard failed twice.
+        """
+        tasks, results = queue.Queue(), queue.Queue()
+        remaining = {}
+        for genre_id, genre in genres.items():
+            shard_ranges = shard_date_range(date_range, shards)
+            remaining[genre_id] = {"genre": genre, "left": len(shard_ranges), "cards": [], "complete": True,
+                                   "stats": StreamStats()}
+            for shard in shard_ranges:
+                url = SEARCH_URL.format(genre=genre, date_range=shard)
+                if self.known_ids is not None:
+                    url += NEWEST_FIRST
+                tasks.put({"genre_id": genre_id, "url": url})
+
+        n_workers = max(1, min(self.workers, tasks.qsize()))
+        for _ in range(n_workers):
+            tasks.put(None)
+        threads = [threading.Thread(target=self._worker, args=(tasks, results), daemon=True)
+                   for _ in range(n_workers)]
+        for thread in threads:
+            thread.start()
+
+        while remaining:
+            task, cards, stats = results.get()
+            state = remaining[task["genre_id"]]
+            if cards is None:
+                state["complete"] = False
+            else:
+                state["cards"].extend(cards)
+            if stats is not None:
+                state["stats"].merge(stats)
+            state["left"] -= 1
+            if state["left"] == 0:
+                del remaining[task["genre_id"]]
+                if self.extraction_mode == "stream":
+                    print(f"{state['genre']}: {state['stats'].report()}")
+                yield task["genre_id"], state["genre"], state["cards"], state["complete"]
+
+        for thread in threads:
+            thread.join()
@@ -0,0 +1,105 @@
+import os
+import json
+import time
+import threading
+
+# Per-movie states, in the order a movie moves through them
+SCRAPED = "scraped"
+TRAILER_RESOLVED = "trailer_resolved"
+AUDIO_DONE = "audio_done"
+POSTER_DONE = "poster_done"
+COMMITTED = "committed"
+DROPPED = "dropped"
+STATE_ORDER = [SCRAPED, TRAILER_RESOLVED, AUDIO_DONE, POSTER_DONE, COMMITTED]
+
+# Per-genre events
+GENRE_STARTED = "genre_started"
+GENRE_DONE = "genre_done"
+
+
+class CrawlJournal:
+    """
+    Append-only JSONL journal of crawl progress, so an interrupted run can resume.
+
+    Every event is flushed and fsync'd before the call returns. On open, the
+    existing journal is replayed: genres that finished scraping keep their
+    cards, and each movie keeps its last state and resolved trailer URL. A
+    torn last line from a crash is ignored.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.genres_done = set()
+        self.cards_by_genre = {}
+        self.states = {}
+        self.trailer_urls = {}
+        self._replay()
+        self.file = open(path, "a", encoding="utf-8")
+        # Terminate a torn last line so the next event starts on its own line
+        if self.file.tell() > 0:
+            with open(path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    self.file.write("\n")
+
+    def _replay(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                self._apply(event)
+
+    def _apply(self, event):
+        kind = event["event"]
+        if kind == GENRE_STARTED:
+            self.genres_done.discard(event["genre"])
+            self.cards_by_genre[event["genre"]] = []
+        elif kind == GENRE_DONE:
+            self.genres_done.add(event["genre"])
+        elif kind == SCRAPED:
+            self.cards_by_genre.setdefault(event["genre"], []).append(event["card"])
+        else:
+            self.states[event["imdb_id"]] = kind
+            if kind == TRAILER_RESOLVED:
+                self.trailer_urls[event["imdb_id"]] = event["trailer_url"]
+
+    def _write(self, events):
+        with self.lock:
+            for event in events:
+                event["ts"] = time.time()
+                self.file.write(json.dumps(event) + "\n")
+                self._apply(event)
+            self.file.flush()
+            os.fsync(self.file.fileno())
+
+    def record(self, kind, imdb_id, **fields):
+        """Record a state transition for one movie."""
+        self._write([dict(event=kind, imdb_id=imdb_id, **fields)])
+
+    def record_genre(self, genre, cards):
+        """Record every card scraped for a genre, then mark the genre done."""
+        events = [{"event": GENRE_STARTED, "genre": genre}]
+        events += [{"event": SCRAPED, "genre": genre, "card": card} for card in cards]
+        events.append({"event": GENRE_DONE, "genre": genre})
+        self._write(events)
+
+    def state(self, imdb_id):
+        """Return the last recorded state of a movie, or None."""
+        return self.states.get(imdb_id)
+
+    def reached(self, imdb_id, state):
+        """True if the movie has got at least as far as `state` (a dropped movie reaches nothing)."""
+        current = self.states.get(imdb_id)
+        if current not in STATE_ORDER:
+            return False
+        return STATE_ORDER.index(current) >= STATE_ORDER.index(state)
+
+    def finish(self):
+        """Close the journal and set it aside once the run's output has been saved."""
+        self.file.close()
+        os.replace(self.path, self.path + ".done")
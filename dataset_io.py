@@ -0,0 +1,119 @@
+import os
+import shutil
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from genre_bits import genre_masks, mask_to_genre_lists
+
+COLUMNS = ["Genre", "Genre Mask", "Title", "Runtime (min)", "IMDb Score", "Votes", "IMDb ID", "Poster URL"]
+
+# Arrow schema of the dataset: genres as a native list of genre ids, typed numeric columns
+SCHEMA = pa.schema([
+    ("Genre", pa.list_(pa.int8())),
+    ("Genre Mask", pa.uint32()),
+    ("Title", pa.string()),
+    ("Runtime (min)", pa.int32()),
+    ("IMDb Score", pa.float32()),
+    ("Votes", pa.int64()),
+    ("IMDb ID", pa.string()),
+    ("Poster URL", pa.string()),
+])
+
+# Matching pandas dtypes (nullable integers so missing values survive)
+DTYPES = {
+    "Title": "string",
+    "Runtime (min)": "Int32",
+    "IMDb Score": "float32",
+    "Votes": "Int64",
+    "IMDb ID": "string",
+    "Poster URL": "string",
+}
+
+
+def genre_string_masks(genres):
+    """Build uint32 masks from stringified lists like '[5, 7]', without parsing each row into a list."""
+    text = pa.array(genres.astype("string").to_numpy(dtype=object, na_value=None), type=pa.string())
+    digits = pc.split_pattern(pc.utf8_trim_whitespace(pc.replace_substring_regex(text, r"\D+", " ")), " ")
+    ids = pc.list_flatten(digits)
+    valid = pc.not_equal(ids, "")
+    rows = pc.filter(pc.list_parent_indices(digits), valid).to_numpy()
+    ids = pc.cast(pc.filter(ids, valid), pa.uint32()).to_numpy()
+    masks = np.zeros(len(genres), dtype=np.uint32)
+    np.bitwise_or.at(masks, rows, np.left_shift(np.uint32(1), ids))
+    return masks
+
+def to_typed_frame(df):
+    """Coerce a dataset frame to the standard columns and dtypes."""
+    df = df.reindex(columns=COLUMNS)
+    # The bitmask is the source of truth; fill it from the genres only where older data lacks it
+    missing = df["Genre Mask"].isna().to_numpy()
+    if missing.any():
+        genres = df["Genre"][missing]
+        is_string = np.ones(len(genres), dtype=bool) if isinstance(genres.dtype, pd.StringDtype) \
+            else genres.map(lambda g: isinstance(g, str)).to_numpy(dtype=bool)
+        masks = np.zeros(len(genres), dtype=np.uint32)
+        masks[is_string] = genre_string_masks(genres[is_string])
+        masks[~is_string] = genre_masks(genres[~is_string])
+        df["Genre Mask"] = df["Genre Mask"].astype("float64")
+        df.loc[missing, "Genre Mask"] = masks
+    df["Genre Mask"] = df["Genre Mask"].astype("uint32")
+    df["Genre"] = mask_to_genre_lists(df["Genre Mask"])
+    for column, dtype in DTYPES.items():
+        df[column] = pd.to_numeric(df[column], errors="coerce").astype(dtype) if dtype != "string" \
+            else df[column].astype(dtype)
+    return df
+
+def dataset_format(path):
+    """Pick the storage format from the path: '.csv' files are CSV, anything else is Parquet."""
+    return "csv" if path.lower().endswith(".csv") else "parquet"
+
+def load_dataset(path):
+    """Load a dataset from CSV or Parquet (file or partitioned directory) into pandas."""
+    if dataset_format(path) == "csv":
+        return to_typed_frame(pd.read_csv(path))
+
+    table = pq.read_table(path)
+    # Partition columns come back with inferred types; restore the plain schema
+    table = table.select(COLUMNS).cast(SCHEMA)
+    df = table.drop(["Genre"]).to_pandas(types_mapper={
+        pa.int32(): pd.Int32Dtype(),
+        pa.int64(): pd.Int64Dtype(),
+        pa.string(): pd.StringDtype(),
+    }.get)
+    df.insert(0, "Genre", table.column("Genre").to_pylist())
+    return df
+
+def save_dataset(df, path, partition_cols=None):
+    """Save a dataset as CSV or Parquet; Parquet output can be partitioned by columns."""
+    df = to_typed_frame(df)
+    if dataset_format(path) == "csv":
+        df.to_csv(path, index=False, encoding="utf-8")
+        return
+
+    table = pa.Table.from_pandas(df, schema=SCHEMA, preserve_index=False)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    # Write next to the target and swap it in, so a save replaces the dataset instead of adding files to it
+    partial = path + ".part"
+    remove_path(partial)
+    if partition_cols:
+        pq.write_to_dataset(table, root_path=partial, partition_cols=partition_cols)
+    else:
+        pq.write_table(table, partial, compression="zstd")
+    if os.path.isdir(path) or os.path.isdir(partial):
+        old = path + ".old"
+        remove_path(old)
+        if os.path.exists(path):
+            os.rename(path, old)
+        os.rename(partial, path)
+        remove_path(old)
+    else:
+        os.replace(partial, path)
+
+def remove_path(path):
+    """Delete a file or directory tree if it exists."""
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    elif os.path.exists(path):
+        os.remove(path)
@@ -0,0 +1,122 @@
+import os
+import json
+import cv2
+import numpy as np
+import pandas as pd
+
+# Posters are stored at a fixed (height, width) so each shard is one uint8 array
+POSTER_SHAPE = (300, 200)
+INDEX_FILE = "index.parquet"
+META_FILE = "meta.json"
+
+
+def shard_paths(out_dir, shard):
+    return (os.path.join(out_dir, f"posters-{shard:05d}.npy"),
+            os.path.join(out_dir, f"audio-{shard:05d}.bin"))
+
+def load_poster(path, poster_shape=POSTER_SHAPE):
+    """Decode a poster to an RGB uint8 array of poster_shape, or None if it can't be read."""
+    image = cv2.imread(path, cv2.IMREAD_COLOR)
+    if image is None:
+        return None
+    image = cv2.resize(image, (poster_shape[1], poster_shape[0]), interpolation=cv2.INTER_AREA)
+    return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+def export_shards(imdb_ids, media_paths, out_dir, shard_size=1024, poster_shape=POSTER_SHAPE):
+    """
+    Pack posters and audio into fixed-size shards with an index keyed by IMDb ID.
+
+    media_paths(imdb_id) returns (audio_path, poster_path), or None if the
+    movie has no media. Each shard is a posters-NNNNN.npy array of shape
+    (n, height, width, 3) written through np.memmap and an audio-NNNNN.bin file
+    of the raw opus bytes back to back. index.parquet maps every IMDb ID to its
+    shard, row and audio byte range. Returns the number of items written.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    items = []
+    for imdb_id in imdb_ids:
+        paths = media_paths(imdb_id)
+        if paths and all(p and os.path.exists(p) for p in paths):
+            items.append((imdb_id, *paths))
+    skipped = len(imdb_ids) - len(items)
+
+    index = {"imdb_id": [], "shard": [], "row": [], "audio_offset": [], "audio_length": []}
+    n_shards = -(-len(items) // shard_size)
+    for shard in range(n_shards):
+        chunk = items[shard * shard_size:(shard + 1) * shard_size]
+        poster_path, audio_path = shard_paths(out_dir, shard)
+        posters = np.lib.format.open_memmap(poster_path, mode="w+", dtype=np.uint8,
+                                            shape=(len(chunk), *poster_shape, 3))
+        offset = 0
+        with open(audio_path, "wb") as audio_out:
+            for row, (imdb_id, audio_file, poster_file) in enumerate(chunk):
+                poster = load_poster(poster_file, poster_shape)
+                if poster is None:
+                    print(f"Could not decode poster for {imdb_id}, storing a blank one")
+                else:
+                    posters[row] = poster
+                with open(audio_file, "rb") as f:
+                    audio = f.read()
+                audio_out.write(audio)
+                index["imdb_id"].append(imdb_id)
+                index["shard"].append(shard)
+                index["row"].append(row)
+                index["audio_offset"].append(offset)
+                index["audio_length"].append(len(audio))
+                offset += len(audio)
+        posters.flush()
+        del posters
+
+    pd.DataFrame(index).astype({"shard": "int32", "row": "int32", "audio_offset": "int64",
+                                "audio_length": "int64"}).to_parquet(os.path.join(out_dir, INDEX_FILE), index=False)
+    with open(os.path.join(out_dir, META_FILE), "w", encoding="utf-8") as f:
+        json.dump({"shard_size": shard_size, "poster_shape": list(poster_shape), "shards": n_shards,
+                   "items": len(items)}, f)
+    print(f"Exported {len(items)} items in {n_shards} shards to {out_dir}"
+          + (f" ({skipped} without media skipped)" if skipped else ""))
+    return len(items)
+
+
+class ShardedDataset:
+    """
+    Random access to an export_shards directory.
+
+    Items are looked up by IMDb ID (or position) in O(1); shards are opened
+    lazily as memory maps, so posters come back as zero-copy array views and
+    audio as memoryview slices of the shard file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        index = pd.read_parquet(os.path.join(path, INDEX_FILE))
+        self.ids = index["imdb_id"].tolist()
+        self.positions = {imdb_id: i for i, imdb_id in enumerate(self.ids)}
+        self.shard = index["shard"].to_numpy()
+        self.row = index["row"].to_numpy()
+        self.audio_offset = index["audio_offset"].to_numpy()
+        self.audio_length = index["audio_length"].to_numpy()
+        self._posters = {}
+        self._audio = {}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, imdb_id):
+        return imdb_id in self.positions
+
+    def _open(self, shard):
+        if shard not in self._posters:
+            poster_path, audio_path = shard_paths(self.path, shard)
+            self._posters[shard] = np.load(poster_path, mmap_mode="r")
+            self._audio[shard] = np.memmap(audio_path, dtype=np.uint8, mode="r") \
+                if os.path.getsize(audio_path) else np.empty(0, dtype=np.uint8)
+        return self._posters[shard], self._audio[shard]
+
+    def item(self, i):
+        """Return (poster array, audio bytes as a memoryview) for the i-th item."""
+        posters, audio = self._open(int(self.shard[i]))
+        start = int(self.audio_offset[i])
+        return posters[self.row[i]], memoryview(audio[start:start + int(self.audio_length[i])])
+
+    def __getitem__(self, imdb_id):
+        return self.item(self.positions[imdb_id])
@@ -0,0 +1,112 @@
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import cv2
+import numpy as np
+import yt_dlp
+
+# Low-resolution video-only stream; the sampler only needs small frames to hash
+STREAM_FORMAT = "bestvideo[height<=480][ext=mp4]/best[height<=480]/best"
+
+
+def average_hash(frame, hash_size=3):
+    """Perceptual average hash of a BGR frame: one bit per cell of a hash_size x hash_size grid."""
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    small = cv2.resize(gray, (hash_size, hash_size), interpolation=cv2.INTER_AREA)
+    return np.packbits(small > small.mean()).tobytes()
+
+
+class HashBuffer:
+    """The last `size` distinct frame hashes; a frame is new if its hash is not among them."""
+
+    def __init__(self, size=20):
+        self.size = size
+        self.hashes = OrderedDict()
+
+    def add(self, frame_hash):
+        """Remember a hash; returns False if it was already in the buffer."""
+        if frame_hash in self.hashes:
+            self.hashes.move_to_end(frame_hash)
+            return False
+        self.hashes[frame_hash] = None
+        if len(self.hashes) > self.size:
+            self.hashes.popitem(last=False)
+        return True
+
+
+def resolve_stream_url(url):
+    """Direct video stream URL for a trailer page, or None for YouTube Shorts."""
+    if "/shorts/" in url:
+        return None
+    with yt_dlp.YoutubeDL({"format": STREAM_FORMAT, "quiet": True, "no_warnings": True}) as ydl:
+        info = ydl.extract_info(url, download=False)
+    if "/shorts/" in info.get("original_url", "") or "/shorts/" in info.get("webpage_url", ""):
+        return None
+    return info["url"]
+
+def sample_frames(source, output_dir, hash_size=3, buffer_size=20, min_frame_interval_sec=1.0):
+    """
+    Decode a video with OpenCV and save one frame per interval unless it duplicates a recent one.
+
+    Frames between sampling points are only grabbed, not decoded to images.
+    A sampled frame is written as <output_dir>/frame_<ms>.jpg when its
+    average hash is not among the last buffer_size kept hashes.
+    Returns the number of frames saved.
+    """
+    capture = cv2.VideoCapture(source)
+    if not capture.isOpened():
+        raise IOError(f"Could not open video {source}")
+    os.makedirs(output_dir, exist_ok=True)
+    buffer = HashBuffer(buffer_size)
+    next_ms, saved = 0.0, 0
+    try:
+        while capture.grab():
+            position_ms = capture.get(cv2.CAP_PROP_POS_MSEC)
+            if position_ms < next_ms:
+                continue
+            next_ms = position_ms + min_frame_interval_sec * 1000
+            ok, frame = capture.retrieve()
+            if not ok:
+                break
+            if buffer.add(average_hash(frame, hash_size)):
+                cv2.imwrite(os.path.join(output_dir, f"frame_{int(position_ms):08d}.jpg"), frame)
+                saved += 1
+    finally:
+        capture.release()
+    return saved
+
+def sample_trailer(imdb_id, source, output_root, hash_size=3, buffer_size=20, min_frame_interval_sec=1.0):
+    """Sample one trailer (URL or local file) into <output_root>/<imdb_id>; returns (imdb_id, frames saved)."""
+    # Each worker process decodes one video; OpenCV's own threads would only oversubscribe the cores
+    cv2.setNumThreads(1)
+    try:
+        if source.startswith(("http://", "https://")):
+            source = resolve_stream_url(source)
+            if source is None:
+                print(f"Skipping {imdb_id}: trailer is a YouTube Short")
+                return imdb_id, 0
+        saved = sample_frames(source, os.path.join(output_root, imdb_id), hash_size, buffer_size,
+                              min_frame_interval_sec)
+        print(f"{saved} frames sampled for {imdb_id}")
+        return imdb_id, saved
+    except Exception as e:
+        print(f"Error sampling frames for {imdb_id}: {e}")
+        return imdb_id, 0
+
+def sample_trailers(trailers, output_root, workers=None, hash_size=3, buffer_size=20, min_frame_interval_sec=1.0):
+    """
+    Sample frames from many trailers across a process pool.
+
+    trailers maps IMDb ID -> trailer URL or local video path. Returns a dict
+    of IMDb ID -> frames saved. Scripts calling this must guard their entry
+    point with `if __name__ == "__main__":` for platforms that spawn workers.
+    """
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = [executor.submit(sample_trailer, imdb_id, source, output_root, hash_size, buffer_size,
+                                   min_frame_interval_sec)
+                   for imdb_id, source in trailers.items()]
+        for future in as_completed(futures):
+            imdb_id, saved = future.result()
+            results[imdb_id] = saved
+    return results
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# Genre ids run 0-25 (see the genres dict in ver2.py); each one is a bit in a uint32 mask
+N_GENRES = 26
+GENRE_BITS = np.arange(N_GENRES, dtype=np.uint32)
+
+
+def genre_bit(genre_id):
+    """Mask with only the given genre set."""
+    return np.uint32(1 << genre_id)
+
+def genre_masks(genre_lists):
+    """Convert a sequence of genre-id lists to a uint32 mask array."""
+    genre_lists = pd.Series(list(genre_lists), dtype=object)
+    exploded = genre_lists.explode().dropna()
+    masks = np.zeros(len(genre_lists), dtype=np.uint32)
+    np.bitwise_or.at(masks, exploded.index.to_numpy(),
+                     np.left_shift(np.uint32(1), exploded.to_numpy(dtype=np.uint32)))
+    return masks
+
+def multi_hot(masks):
+    """Expand uint32 masks to an (N x 26) uint8 multi-hot matrix."""
+    masks = np.asarray(masks, dtype=np.uint32)
+    return ((masks[:, None] >> GENRE_BITS) & 1).astype(np.uint8)
+
+def mask_to_genre_lists(masks):
+    """Convert uint32 masks back to sorted genre-id lists, without a Python loop over bits."""
+    matrix = multi_hot(masks)
+    _, genre_ids = np.nonzero(matrix)
+    offsets = np.concatenate([[0], np.cumsum(matrix.sum(axis=1, dtype=np.int32))]).astype(np.int32)
+    return pa.ListArray.from_arrays(offsets, genre_ids.astype(np.int8)).to_pylist()
+
+def export_multi_hot(df, path):
+    """Save the dataset's genres as an (N x 26) uint8 multi-hot matrix aligned with its IMDb IDs."""
+    np.savez(path, imdb_ids=df["IMDb ID"].astype(str).to_numpy(), genres=multi_hot(df["Genre Mask"]))
@@ -0,0 +1,333 @@
+import re
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from lxml import html as lxml_html
+from selenium.webdriver.common.by import By
+
+# XPath to find all result list items (li elements) on the IMDb search page
+RESULTS_XPATH = '//*[@id="__next"]/main/div[2]/div[3]/section/section/div/section/section/div[2]/div/section/div[2]/div[2]/ul/li'
+POSTER_XPATH = './/div[contains(@class, "ipc-media")]/img'
+
+IMDB_ID_RE = re.compile(r'/title/(tt\d+)/')
+
+# Fields of a parsed result card, in output column order
+CARD_COLUMNS = ["Title", "Runtime (min)", "IMDb Score", "Votes", "IMDb ID", "Poster URL"]
+
+
+def parse_runtime(runtime_str):
+    """Convert '1h 40m' format to total minutes"""
+    hours = re.findall(r'(\d+)h', runtime_str)
+    minutes = re.findall(r'(\d+)m', runtime_str)
+    total_minutes = 0
+    if hours:
+        total_minutes += int(hours[0]) * 60
+    if minutes:
+        total_minutes += int(minutes[0])
+    return int(total_minutes) if total_minutes > 0 else None
+
+def parse_votes(votes_str):
+    """Convert vote strings like '1.9M', '24K' to numeric values"""
+    if not votes_str or not isinstance(votes_str, str):
+        return None
+
+    votes_str = re.sub(r'[(),\s]', '', votes_str)
+
+    try:
+        if votes_str.endswith('K'):
+            return int(float(votes_str[:-1]) * 1000)
+        elif votes_str.endswith('M'):
+            return int(float(votes_str[:-1]) * 1000000)
+        else:
+            return int(votes_str)
+    except ValueError:
+        return None
+
+def parse_imdb_score(score_str):
+    """Ensure IMDb score is numeric or set it to None"""
+    try:
+        return float(score_str) if score_str and score_str.replace('.', '', 1).isdigit() else None
+    except ValueError:
+        return None
+
+
+######################################################
+#   Batch parsers
+######################################################
+# Each takes a whole column of raw strings and returns a nullable typed Series
+# equal to applying the scalar parser to every string. Missing values and
+# anything that isn't a str give <NA>, and so do results that don't fit the
+# column: Int64 values of 2**63 or more in magnitude (and infinite vote counts),
+# where the scalar parsers return a Python int or raise OverflowError.
+# The regexes are run once over the column with pyarrow and the arithmetic is
+# done with NumPy; only the rare strings with non-ASCII digits or spaces (which
+# RE2 doesn't treat like Python's re) go through the scalar parser.
+
+INT64_MAX = np.iinfo(np.int64).max
+INT64_MAX_DIGITS = str(INT64_MAX)
+
+# Python int()/float() literals as accepted by parse_votes, once whitespace and (),
+# are removed: underscores between digits, optional sign, exponent, inf/nan
+_DIGITS = r'[0-9]+(?:_[0-9]+)*'
+VOTES_INT_RE = rf'^(?P<sign>[+-]?)(?P<digits>{_DIGITS})$'
+VOTES_SCALED_RE = (rf'^(?P<number>[+-]?(?:{_DIGITS}\.(?:{_DIGITS})?|\.{_DIGITS}|{_DIGITS})(?:[eE][+-]?{_DIGITS})?'
+                   rf'|[+-]?(?i:inf|infinity|nan))(?P<unit>[KM])$')
+# The forms IMDb actually uses ('(24K)', '1.9M', '1,234'), checked over every row first
+VOTES_INT_FAST_RE = r'^-?[0-9]+$'
+VOTES_NUMBER_FAST_RE = r'^[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)$'
+# Non-ASCII characters Python's re and int()/float() treat as digits or whitespace
+# (a superset of them, in RE2 syntax); other non-ASCII text parses to <NA> both ways
+UNICODE_DIGIT_RE = r'[^\P{Nd}0-9]'
+UNICODE_DIGIT_OR_SPACE_RE = r'[^\P{Nd}0-9]|[^\P{Z} ]|\x{85}'
+# Python's \s for ASCII text, plus the characters parse_votes strips
+VOTES_STRIP_RE = r'[(),\t\n\x0b\x0c\r\x1c-\x1f ]'
+
+
+def _text(values):
+    """Return (pyarrow string array, index) of a column; entries that aren't str become null."""
+    index = values.index if isinstance(values, pd.Series) else None
+    try:
+        array = pa.array(values, type=pa.string(), from_pandas=True)
+    except (pa.ArrowTypeError, pa.ArrowInvalid):
+        array = pa.array([v if isinstance(v, str) else None for v in values], type=pa.string())
+    return array, index
+
+def _field(struct, name):
+    """One named group of an extract_regex result, with rows that didn't match as null."""
+    return pc.if_else(pc.is_valid(struct), pc.struct_field(struct, name), None)
+
+def _to_numpy(array, fill, dtype):
+    """Writable NumPy copy of an arrow array with nulls replaced by `fill`."""
+    return pc.fill_null(array, fill).to_numpy(zero_copy_only=False).astype(dtype)
+
+def _fits_int64(digits):
+    """Mask of digit strings (no sign, leading zeros allowed) whose value fits in int64."""
+    significant = pc.utf8_ltrim(digits, "0")
+    length = _to_numpy(pc.utf8_length(significant), 0, np.int64)
+    longest = _to_numpy(pc.less_equal(significant, INT64_MAX_DIGITS), False, bool)
+    return (length < len(INT64_MAX_DIGITS)) | ((length == len(INT64_MAX_DIGITS)) & longest)
+
+def _parse_ints(digits, fits):
+    """int64 values of the digit strings that fit (0 elsewhere)."""
+    safe = pc.if_else(pa.array(fits), digits, "0")
+    return _to_numpy(pc.cast(pc.fill_null(safe, "0"), pa.int64()), 0, np.int64)
+
+def _scalar_fallback(array, values, mask, parse, pattern=UNICODE_DIGIT_RE):
+    """Run the scalar parser over the non-ASCII strings matching `pattern`, updating values/mask in place."""
+    non_ascii = np.flatnonzero(~_to_numpy(pc.string_is_ascii(array), True, bool))
+    if not len(non_ascii):
+        return
+    strings = pc.take(array, pa.array(non_ascii))
+    matches = _to_numpy(pc.match_substring_regex(strings, pattern), False, bool)
+    for i, value in zip(non_ascii[matches], pc.filter(strings, pa.array(matches)).to_pylist()):
+        try:
+            parsed = parse(value)
+        except OverflowError:
+            parsed = None
+        if parsed is None or (isinstance(parsed, int) and abs(parsed) > INT64_MAX):
+            mask[i] = True
+        else:
+            values[i] = parsed
+            mask[i] = False
+
+def _series(values, mask, index, float_type=False):
+    array = pd.arrays.FloatingArray(values, mask) if float_type else pd.arrays.IntegerArray(values, mask)
+    return pd.Series(array, index=index)
+
+def parse_runtime_batch(values):
+    """Batch parse_runtime: '1h 40m' strings to total minutes (Int64)."""
+    array, index = _text(values)
+    hours = _field(pc.extract_regex(array, r'(?P<n>[0-9]+)h'), "n")
+    minutes = _field(pc.extract_regex(array, r'(?P<n>[0-9]+)m'), "n")
+    hours_fit, minutes_fit = _fits_int64(hours), _fits_int64(minutes)
+    h, m = _parse_ints(hours, hours_fit), _parse_ints(minutes, minutes_fit)
+
+    # Exact int64 check for h * 60 + m <= INT64_MAX
+    fits = hours_fit & minutes_fit & (h <= (INT64_MAX - m) // 60)
+    total = np.where(fits, h * 60 + m, 0)
+    mask = ~fits | (total <= 0)
+    _scalar_fallback(array, total, mask, parse_runtime)
+    return _series(total, mask, index)
+
+def _scale_votes(number, unit_k, valid):
+    """int(float(number) * 1000 or 1000000) as int64 where valid and finite in int64, and that mask."""
+    safe = pc.if_else(pa.array(valid), number, "0")
+    multiplier = np.where(unit_k, 1000.0, 1000000.0)
+    with np.errstate(invalid="ignore", over="ignore"):
+        product = np.trunc(_to_numpy(pc.cast(pc.fill_null(safe, "0"), pa.float64()), 0.0, np.float64) * multiplier)
+        fits = valid & (np.abs(product) < 2.0 ** 63)
+    return np.where(fits, product, 0).astype(np.int64), fits
+
+def _parse_votes(cleaned):
+    """(counts, parsed mask) of vote strings with (), and whitespace removed, by parse_votes' full grammar."""
+    plain = pc.extract_regex(cleaned, VOTES_INT_RE)
+    digits = pc.replace_substring(_field(plain, "digits"), "_", "")
+    plain_fit = _to_numpy(pc.is_valid(digits), False, bool) & _fits_int64(digits)
+    negative = _to_numpy(pc.equal(_field(plain, "sign"), "-"), False, bool)
+    counts = _parse_ints(digits, plain_fit)
+    counts = np.where(negative, -counts, counts)
+
+    # inf and nan don't capture a number, so they stay unparsed (<NA>)
+    scaled = pc.extract_regex(cleaned, VOTES_SCALED_RE)
+    number = pc.replace_substring(_field(scaled, "number"), "_", "")
+    unit_k = _to_numpy(pc.equal(_field(scaled, "unit"), "K"), False, bool)
+    scaled_counts, scaled_fit = _scale_votes(number, unit_k, _to_numpy(pc.is_valid(number), False, bool))
+    return np.where(scaled_fit, scaled_counts, counts), plain_fit | scaled_fit
+
+def parse_votes_batch(values):
+    """Batch parse_votes: vote strings like '1.9M', '(24K)' to counts (Int64)."""
+    array, index = _text(values)
+
+    # Fast path for the usual forms: no regex extraction, just matches, slices and casts
+    trimmed = pc.replace_substring(pc.ascii_trim(array, "() "), ",", "")
+    unit_k = _to_numpy(pc.ends_with(trimmed, "K"), False, bool)
+    has_unit = unit_k | _to_numpy(pc.ends_with(trimmed, "M"), False, bool)
+    number = pc.if_else(pa.array(has_unit), pc.utf8_slice_codeunits(trimmed, 0, -1), trimmed)
+    plain = ~has_unit & _to_numpy(pc.match_substring_regex(number, VOTES_INT_FAST_RE), False, bool)
+    plain &= _fits_int64(pc.utf8_ltrim(number, "-"))
+    counts = _parse_ints(number, plain)
+    scaled = has_unit & _to_numpy(pc.match_substring_regex(number, VOTES_NUMBER_FAST_RE), False, bool)
+    scaled_counts, scaled = _scale_votes(number, unit_k, scaled)
+    counts = np.where(scaled, scaled_counts, counts)
+    parsed = plain | scaled
+
+    # Underscores, exponents, inf/nan, inner whitespace and junk: the full grammar, on the rows left over
+    rest = np.flatnonzero(~parsed & _to_numpy(pc.string_is_ascii(array), False, bool))
+    if len(rest):
+        stripped = pc.replace_substring_regex(pc.take(array, pa.array(rest)), VOTES_STRIP_RE, "")
+        counts[rest], parsed[rest] = _parse_votes(stripped)
+
+    mask = ~parsed
+    _scalar_fallback(array, counts, mask, parse_votes, UNICODE_DIGIT_OR_SPACE_RE)
+    return _series(counts, mask, index)
+
+def parse_imdb_score_batch(values):
+    """Batch parse_imdb_score: numeric score strings to Float64."""
+    array, index = _text(values)
+    numeric = _to_numpy(pc.match_substring_regex(array, r'^(?:[0-9]+\.?[0-9]*|\.[0-9]+)$'), False, bool)
+    safe = pc.if_else(pa.array(numeric), array, "0")
+    scores = _to_numpy(pc.cast(pc.fill_null(safe, "0"), pa.float64()), 0.0, np.float64)
+    mask = ~numeric
+    _scalar_fallback(array, scores, mask, parse_imdb_score)
+    return _series(scores, mask, index, float_type=True)
+
+def parse_card_lines(lines):
+    """Split the text lines of a result card into title, runtime, score and votes."""
+    title = lines[0].split('. ', 1)[-1] if lines and '. ' in lines[0] else lines[0] if lines else None
+    runtime = lines[2] if len(lines) > 2 else None
+    imdb_score = lines[4] if len(lines) > 4 else None
+    votes = lines[5] if len(lines) > 5 else None
+    return title, runtime, imdb_score, votes
+
+def build_card(title, runtime, imdb_score, votes, imdb_id, poster_url):
+    """Build the parsed record for one result card."""
+    return {
+        "Title": title,
+        "Runtime (min)": parse_runtime(runtime) if runtime else None,
+        "IMDb Score": parse_imdb_score(imdb_score),
+        "Votes": parse_votes(votes),
+        "IMDb ID": imdb_id,
+        "Poster URL": poster_url,
+    }
+
+def get_imdb_id(element):
+    """Extract IMDb ID from the movie element."""
+    try:
+        link = element.find_element(By.TAG_NAME, 'a').get_attribute('href')
+        imdb_id = IMDB_ID_RE.search(link).group(1) if link else None
+        return str(imdb_id)
+    except Exception as e:
+        print(f"Error extracting IMDb ID: {e}")
+        return None
+
+def get_movie_poster(element):
+    """Extract and download movie poster."""
+    try:
+        img_element = element.find_element(By.XPATH, POSTER_XPATH)
+        poster_url = img_element.get_attribute('src')
+        return poster_url
+    except Exception as e:
+        print(f"Error extracting poster URL: {e}")
+        return None
+
+def extract_cards_from_elements(driver):
+    """Extract result cards through per-element WebDriver calls."""
+    cards = []
+    for element in driver.find_elements(By.XPATH, RESULTS_XPATH):
+        lines = element.text.strip().split("\n")
+        title, runtime, imdb_score, votes = parse_card_lines(lines)
+        cards.append(build_card(title, runtime, imdb_score, votes, get_imdb_id(element), get_movie_poster(element)))
+    return cards
+
+
+######################################################
+#   page_source extraction
+######################################################
+
+# Elements whose text Chrome renders on a line of its own inside a card
+_CARD_LINE_CLASSES = (
+    "ipc-title__text",
+    "dli-title-metadata-item",
+    "ipc-rating-star--rating",
+    "ipc-rating-star--voteCount",
+)
+_CARD_LINES_XPATH = " | ".join(
+    f'.//*[contains(concat(" ", normalize-space(@class), " "), " {cls} ")]' for cls in _CARD_LINE_CLASSES
+)
+
+def _card_lines(li):
+    """Rebuild the rendered text lines of a card from its markup."""
+    lines = []
+    for node in li.xpath(_CARD_LINES_XPATH):
+        text = " ".join(node.text_content().split())
+        if text:
+            lines.append(text)
+    return lines
+
+def _card_imdb_id(li):
+    """Extract IMDb ID from a parsed card, matching get_imdb_id."""
+    try:
+        links = li.xpath('.//a/@href')
+        link = links[0] if links else None
+        imdb_id = IMDB_ID_RE.search(link).group(1) if link else None
+        return str(imdb_id)
+    except Exception as e:
+        print(f"Error extracting IMDb ID: {e}")
+        return None
+
+def _card_poster(li):
+    """Extract the poster URL from a parsed card, matching get_movie_poster."""
+    srcs = li.xpath(POSTER_XPATH + '/@src')
+    if not srcs:
+        print("Error extracting poster URL: no poster image in card")
+        return None
+    return srcs[0]
+
+def parse_result_cards(page_source):
+    """Parse every result card out of one page_source snapshot."""
+    tree = lxml_html.fromstring(page_source)
+    cards = []
+    for li in tree.xpath(RESULTS_XPATH):
+        title, runtime, imdb_score, votes = parse_card_lines(_card_lines(li))
+        cards.append(build_card(title, runtime, imdb_score, votes, _card_imdb_id(li), _card_poster(li)))
+    return cards
+
+def parse_card_fragments(fragments):
+    """Parse result cards from the outerHTML of individual result <li> elements."""
+    tree = lxml_html.fromstring("<ul>" + "".join(fragments) + "</ul>")
+    cards = []
+    for li in tree.xpath('./li'):
+        title, runtime, imdb_score, votes = parse_card_lines(_card_lines(li))
+        cards.append(build_card(title, runtime, imdb_score, votes, _card_imdb_id(li), _card_poster(li)))
+    return cards
+
+def extract_cards_from_page_source(driver):
+    """Extract result cards from a single driver.page_source snapshot."""
+    return parse_result_cards(driver.page_source)
+
+def extract_cards(driver, mode="page_source"):
+    """Extract result cards using the given extraction mode ('page_source' or 'elements')."""
+    if mode == "elements":
+        return extract_cards_from_elements(driver)
+    return extract_cards_from_page_source(driver)
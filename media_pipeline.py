@@ -0,0 +1,325 @@
+import os
+import time
+import shutil
+import queue
+import threading
+import subprocess
+import yt_dlp
+from crawl_journal import TRAILER_RESOLVED, AUDIO_DONE, POSTER_DONE, DROPPED
+from frame_sampler import sample_frames
+from media_store import AUDIO, POSTER
+from poster_fetcher import PosterFetcher
+from run_metrics import metrics
+
+# Sentinel telling a stage worker that its input is exhausted
+STOP = object()
+
+# yt-dlp options for the trailer audio: smallest audio-only stream, no post-processing
+# (the transcode stage turns it into opus separately so downloads and ffmpeg overlap)
+AUDIO_DOWNLOAD_OPTIONS = {
+    'format': 'worstaudio[ext=webm]/worstaudio/worst',
+    'quiet': True,
+    'writemetadata': False,        # Disable metadata file
+    'writethumbnail': False,       # No cover art
+    'noprogress': True,            # Reduces output processing
+    'external_downloader': 'aria2c',  # Faster downloads
+    'external_downloader_args': ['-x16', '-s16', '-j16']
+}
+
+# yt-dlp options when frames are sampled too: one small stream with both video and audio,
+# so a single download feeds the opus transcode and the frame sampler
+TRAILER_DOWNLOAD_OPTIONS = dict(
+    AUDIO_DOWNLOAD_OPTIONS,
+    format='worst[height>=240][vcodec!=none][acodec!=none]/best[height<=480][vcodec!=none][acodec!=none]/worst',
+)
+
+# ffmpeg arguments matching download_audio's FFmpegExtractAudio settings: opus audio is stream-copied
+# as it was there, anything else is encoded to low-bitrate opus
+OPUS_ARGS = ['-vn', '-map_metadata', '-1', '-metadata', 'comment=']
+OPUS_COPY_ARGS = ['-c:a', 'copy']
+OPUS_ENCODE_ARGS = ['-c:a', 'libopus', '-b:a', '32k']
+
+
+class Stage:
+    """One pipeline stage: `workers` threads applying `fn` to jobs from `inbox`."""
+
+    def __init__(self, name, fn, workers):
+        self.name = name
+        self.fn = fn
+        self.workers = workers
+        self.processed = 0
+        self.dropped = 0
+        self.seconds = 0.0
+        self.lock = threading.Lock()
+
+
+class Pipeline:
+    """
+    Run jobs through a chain of stages connected by bounded queues.
+
+    Each stage function takes a job dict and returns it (passed on to the next
+    stage) or None (job dropped). Exceptions also drop the job. Dropped jobs
+    go to `on_drop`, which can clean up partial files. Stages may append
+    (imdb_id, bytes downloaded, seconds) to `trailer_stats` for the report.
+    """
+
+    def __init__(self, stages, queue_size=16, on_drop=None):
+        self.stages = stages
+        self.queue_size = queue_size
+        self.on_drop = on_drop
+        self.elapsed = 0.0
+        self.completed = 0
+        self.trailer_stats = []
+
+    def _worker(self, stage, inbox, outbox):
+        while True:
+            job = inbox.get()
+            if job is STOP:
+                return
+            start = time.perf_counter()
+            try:
+                result = stage.fn(job)
+            except Exception as e:
+                print(f"{stage.name} failed for {job.get('imdb_id')}: {e}")
+                result = None
+            seconds = time.perf_counter() - start
+            metrics.observe(f"pipeline.{stage.name}", seconds, ok=result is not None)
+            with stage.lock:
+                stage.processed += 1
+                stage.seconds += seconds
+                if result is None:
+                    stage.dropped += 1
+            if result is None:
+                if self.on_drop is not None:
+                    # A failing cleanup must not kill the worker, or the queues upstream would block forever
+                    try:
+                        self.on_drop(job)
+                    except Exception as e:
+                        print(f"{stage.name} cleanup failed for {job.get('imdb_id')}: {e}")
+            else:
+                outbox.put(result)
+
+    def run(self, jobs):
+        """Push jobs through every stage and return the ones that made it to the end, in input order."""
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        results = queue.Queue()
+        outboxes = queues[1:] + [results]
+
+        threads = []
+        for stage, inbox, outbox in zip(self.stages, queues, outboxes):
+            stage_threads = [threading.Thread(target=self._worker, args=(stage, inbox, outbox), daemon=True)
+                             for _ in range(stage.workers)]
+            for thread in stage_threads:
+                thread.start()
+            threads.append(stage_threads)
+
+        start = time.perf_counter()
+        for seq, job in enumerate(jobs):
+            job["seq"] = seq
+            queues[0].put(job)
+
+        # Shut stages down in order once everything upstream has drained
+        for stage, inbox, stage_threads in zip(self.stages, queues, threads):
+            for _ in range(stage.workers):
+                inbox.put(STOP)
+            for thread in stage_threads:
+                thread.join()
+        self.elapsed = time.perf_counter() - start
+
+        done = []
+        while not results.empty():
+            done.append(results.get())
+        self.completed = len(done)
+        return sorted(done, key=lambda job: job["seq"])
+
+    def report(self):
+        """Summarize per-stage work and overall throughput."""
+        lines = []
+        for stage in self.stages:
+            avg = stage.seconds / stage.processed if stage.processed else 0.0
+            lines.append(f"  {stage.name:<10} workers={stage.workers:<3} processed={stage.processed:<5} "
+                         f"dropped={stage.dropped:<5} avg={avg:.2f}s")
+        if self.trailer_stats:
+            total_bytes = sum(n_bytes for _, n_bytes, _ in self.trailer_stats)
+            total_seconds = sum(seconds for _, _, seconds in self.trailer_stats)
+            n = len(self.trailer_stats)
+            lines.append(f"  {n} trailers downloaded once: {total_bytes / 1e6:.1f} MB "
+                         f"(avg {total_bytes / n / 1e6:.2f} MB, {total_seconds / n:.1f}s per trailer)")
+        per_minute = self.completed / self.elapsed * 60 if self.elapsed else 0.0
+        lines.append(f"  {self.completed} movies in {self.elapsed:.1f}s ({per_minute:.1f} movies/min)")
+        return "Media pipeline:\n" + "\n".join(lines)
+
+
+def download_trailer_audio(trailer_url, output_dir, imdb_id, download_options=AUDIO_DOWNLOAD_OPTIONS):
+    """Download the raw trailer stream (audio only by default) with yt-dlp and return its path."""
+    os.makedirs(output_dir, exist_ok=True)
+    options = dict(download_options, outtmpl=os.path.join(output_dir, f"{imdb_id}.source.%(ext)s"))
+    with yt_dlp.YoutubeDL(options) as ydl:
+        info = ydl.extract_info(trailer_url, download=True)
+        return ydl.prepare_filename(info)
+
+def audio_codec(path):
+    """Codec name of the first audio stream in a file (e.g. "opus"), or None if ffprobe can't tell."""
+    result = subprocess.run(
+        ['ffprobe', '-v', 'error', '-select_streams', 'a:0', '-show_entries', 'stream=codec_name',
+         '-of', 'csv=p=0', path],
+        capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+def transcode_to_opus(source_file, audio_file):
+    """Write a downloaded stream's audio as opus with ffmpeg, copying it when it already is opus."""
+    codec_args = OPUS_COPY_ARGS if audio_codec(source_file) == "opus" else OPUS_ENCODE_ARGS
+    # audio_file may be a link into the media store; write a new file and swap it in
+    # so the shared object is never rewritten in place
+    root, ext = os.path.splitext(audio_file)
+    partial = f"{root}.part{ext}"
+    try:
+        subprocess.run(
+            ['ffmpeg', '-y', '-loglevel', 'error', '-i', source_file] + OPUS_ARGS + codec_args + [partial],
+            check=True,
+        )
+        os.replace(partial, audio_file)
+    finally:
+        if os.path.exists(partial):
+            os.remove(partial)
+
+def remove_files(paths):
+    """Delete whichever of the given files (or directories) exist."""
+    for path in paths:
+        if path and os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        elif path and os.path.exists(path):
+            os.remove(path)
+
+
+def build_media_pipeline(tmdb_client, audio_dir, poster_dir, workers, queue_size=16, journal=None,
+                         frame_dir=None, hash_size=3, buffer_size=20, media_store=None, poster_fetcher=None):
+    """
+    Build the lookup -> download -> transcode -> poster pipeline for ver2.py.
+
+    Jobs are dicts with "imdb_id" and "poster_url". A job only comes out of the
+    pipeline when both the opus audio and the poster are on disk; otherwise
+    every file it created is removed. With a CrawlJournal, every step is
+    recorded and steps a previous run already finished are skipped.
+
+    With a frame_dir, each trailer is downloaded once with video and audio;
+    the transcode stage writes the opus audio and samples deduplicated frames
+    into <frame_dir>/<imdb_id>/ from that one file before deleting it.
+
+    With a MediaStore, audio and posters already fetched by any earlier crawl
+    are linked into this run's folders instead of downloaded, and new files
+    are moved into the store and linked back.
+
+    Posters go through a PosterFetcher (sized, streamed, conditional GETs);
+    without one, an in-memory one is used for this run only.
+    """
+    if poster_fetcher is None:
+        poster_fetcher = PosterFetcher(":memory:")
+    download_options = AUDIO_DOWNLOAD_OPTIONS if frame_dir is None else TRAILER_DOWNLOAD_OPTIONS
+
+    def reached(job, state):
+        return journal is not None and journal.reached(job["imdb_id"], state)
+
+    def record(job, state, **fields):
+        if journal is not None:
+            journal.record(state, job["imdb_id"], **fields)
+
+    def lookup(job):
+        imdb_id = job["imdb_id"]
+        if reached(job, TRAILER_RESOLVED):
+            job["trailer_url"] = journal.trailer_urls[imdb_id]
+            return job
+
+        job["trailer_url"] = tmdb_client.get_trailer_url(imdb_id)
+        if not job["trailer_url"]:
+            print(f"Skipping {imdb_id}: No trailer available")
+            job["reason"] = "no trailer"
+            return None
+        record(job, TRAILER_RESOLVED, trailer_url=job["trailer_url"])
+        return job
+
+    def stored(job, kind, path):
+        return media_store is not None and media_store.link(job["imdb_id"], kind, path)
+
+    def download(job):
+        if reached(job, AUDIO_DONE):
+            return job
+        # Frames need the video, so the stored audio alone is not enough then
+        if frame_dir is None and stored(job, AUDIO, os.path.join(audio_dir, f"{job['imdb_id']}.opus")):
+            job["audio_stored"] = True
+            return job
+        job["download_start"] = time.perf_counter()
+        with metrics.timer("yt_dlp"):
+            job["source_file"] = download_trailer_audio(job["trailer_url"], audio_dir, job["imdb_id"],
+                                                        download_options)
+        if not os.path.exists(job["source_file"]):
+            print(f"Audio download failed for {job['imdb_id']} - file not found")
+            job["reason"] = "audio download failed"
+            return None
+        return job
+
+    def transcode(job):
+        job["audio_file"] = os.path.join(audio_dir, f"{job['imdb_id']}.opus")
+        if reached(job, AUDIO_DONE):
+            return job
+        if job.pop("audio_stored", False):
+            print(f"Audio for {job['imdb_id']} linked from the media store")
+            record(job, AUDIO_DONE)
+            return job
+        with metrics.timer("ffmpeg"):
+            transcode_to_opus(job["source_file"], job["audio_file"])
+        if media_store is not None:
+            media_store.adopt(job["imdb_id"], AUDIO, job["audio_file"])
+        frames = ""
+        if frame_dir is not None:
+            job["frame_dir"] = os.path.join(frame_dir, job["imdb_id"])
+            with metrics.timer("frame_sample"):
+                n_frames = sample_frames(job["source_file"], job["frame_dir"], hash_size, buffer_size)
+            frames = f" + {n_frames} frames"
+        n_bytes = os.path.getsize(job["source_file"])
+        remove_files([job.pop("source_file")])
+        seconds = time.perf_counter() - job.pop("download_start")
+        pipeline.trailer_stats.append((job["imdb_id"], n_bytes, seconds))
+        metrics.add_bytes("trailer", n_bytes)
+        print(f"Trailer {job['imdb_id']}: {n_bytes / 1e6:.2f} MB -> audio{frames} in {seconds:.1f}s")
+        record(job, AUDIO_DONE)
+        return job
+
+    def poster(job):
+        job["poster_file"] = os.path.join(poster_dir, f"{job['imdb_id']}.jpg")
+        if reached(job, POSTER_DONE):
+            return job
+        if stored(job, POSTER, job["poster_file"]):
+            print(f"Poster for {job['imdb_id']} linked from the media store")
+            record(job, POSTER_DONE)
+            return job
+        try:
+            with metrics.timer("poster_fetch"):
+                fetched = poster_fetcher.fetch(job["poster_url"], job["poster_file"])
+        except Exception as e:
+            print(f"Skipping {job['imdb_id']}: Poster URL not accessible - {e}")
+            job["reason"] = "poster not accessible"
+            return None
+        if media_store is not None:
+            media_store.adopt(job["imdb_id"], POSTER, job["poster_file"])
+        print(f"Poster saved: {job['imdb_id']}.jpg" if fetched else f"Poster unchanged: {job['imdb_id']}.jpg")
+        record(job, POSTER_DONE)
+        return job
+
+    def on_drop(job):
+        # All-or-nothing: a movie without both audio and poster leaves no files behind
+        remove_files([job.get("source_file"), job.get("audio_file"), job.get("frame_dir"), job.get("poster_file")])
+        record(job, DROPPED, reason=job.get("reason", "error"))
+        metrics.count("pipeline", f"dropped: {job.get('reason', 'error')}")
+
+    stages = [
+        Stage("lookup", lookup, workers.get("lookup", 8)),
+        Stage("download", download, workers.get("download", 4)),
+        Stage("transcode", transcode, workers.get("transcode", 2)),
+        Stage("poster", poster, workers.get("poster", 4)),
+    ]
+    pipeline = Pipeline(stages, queue_size=queue_size, on_drop=on_drop)
+    return pipeline
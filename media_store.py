@@ -0,0 +1,146 @@
+import os
+import shutil
+import sqlite3
+import hashlib
+import threading
+
+AUDIO = "audio"
+POSTER = "poster"
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    """Hex SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def link_file(source, dest):
+    """Hard-link source to dest, falling back to a symlink and then a copy; returns how it was placed."""
+    if os.path.lexists(dest):
+        os.remove(dest)
+    os.makedirs(os.path.dirname(dest) or ".", exist_ok=True)
+    try:
+        os.link(source, dest)
+        return "hardlink"
+    except OSError:
+        pass
+    try:
+        os.symlink(os.path.abspath(source), dest)
+        return "symlink"
+    except OSError:
+        shutil.copy2(source, dest)
+        return "copy"
+
+
+class MediaStore:
+    """
+    Content-addressed store of downloaded media shared by every crawl folder.
+
+    Files live once under <root>/objects/<hash[:2]>/<hash><ext>, and an SQLite
+    index maps (IMDb ID, kind) to the content hash. Run folders get hard links
+    into the store, so a movie's audio and poster are downloaded at most once
+    across every genre combination, and identical files stored under
+    different IDs share one object.
+    """
+
+    def __init__(self, root="media_store"):
+        self.root = root
+        self.reused = 0
+        self.reused_bytes = 0
+        self.deduped = 0
+        self.deduped_bytes = 0
+        self.added = 0
+        self.lock = threading.Lock()
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(root, "index.sqlite"), check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS media ("
+            "imdb_id TEXT NOT NULL, kind TEXT NOT NULL, sha256 TEXT NOT NULL, ext TEXT NOT NULL, "
+            "size INTEGER NOT NULL, PRIMARY KEY (imdb_id, kind))"
+        )
+        self.conn.commit()
+
+    def object_path(self, sha256, ext):
+        return os.path.join(self.root, "objects", sha256[:2], sha256 + ext)
+
+    def lookup(self, imdb_id, kind):
+        """Return the stored object path for a movie's media, or None if it isn't stored."""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT sha256, ext FROM media WHERE imdb_id = ? AND kind = ?", (imdb_id, kind)
+            ).fetchone()
+        if row is None:
+            return None
+        path = self.object_path(*row)
+        return path if os.path.exists(path) else None
+
+    def link(self, imdb_id, kind, dest):
+        """Place a stored file at dest (hard link where possible); returns False if it isn't stored."""
+        path = self.lookup(imdb_id, kind)
+        if path is None:
+            return False
+        link_file(path, dest)
+        with self.lock:
+            self.reused += 1
+            self.reused_bytes += os.path.getsize(path)
+        return True
+
+    def adopt(self, imdb_id, kind, path):
+        """
+        Move a freshly downloaded file into the store and link it back at `path`.
+
+        If the same content is already stored (under any IMDb ID), the new copy
+        is dropped and linked to the existing object instead.
+        """
+        sha256 = file_sha256(path)
+        ext = os.path.splitext(path)[1]
+        size = os.path.getsize(path)
+        obj = self.object_path(sha256, ext)
+        with self.lock:
+            if os.path.exists(obj):
+                self.deduped += 1
+                self.deduped_bytes += size
+                os.remove(path)
+            else:
+                os.makedirs(os.path.dirname(obj), exist_ok=True)
+                shutil.move(path, obj)
+                self.added += 1
+            self.conn.execute(
+                "INSERT OR REPLACE INTO media (imdb_id, kind, sha256, ext, size) VALUES (?, ?, ?, ?, ?)",
+                (imdb_id, kind, sha256, ext, size),
+            )
+            self.conn.commit()
+        link_file(obj, path)
+        return obj
+
+    def stats(self):
+        """Return this session's reuse and dedupe counters plus the store's totals."""
+        with self.lock:
+            entries, logical = self.conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM media").fetchone()
+            objects, physical = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM (SELECT DISTINCT sha256, ext, size FROM media)"
+            ).fetchone()
+        return {
+            "added": self.added,
+            "reused": self.reused,
+            "reused_bytes": self.reused_bytes,
+            "deduped": self.deduped,
+            "deduped_bytes": self.deduped_bytes,
+            "entries": entries,
+            "objects": objects,
+            "stored_bytes": physical,
+            "saved_bytes": logical - physical,
+        }
+
+    def report(self):
+        s = self.stats()
+        return (f"Media store: {s['added']} files added, {s['reused']} reused from earlier crawls "
+                f"({s['reused_bytes'] / 1e6:.1f} MB not downloaded again), {s['deduped']} identical files "
+                f"deduplicated ({s['deduped_bytes'] / 1e6:.1f} MB); store holds {s['entries']} entries in "
+                f"{s['objects']} objects, {s['stored_bytes'] / 1e6:.1f} MB "
+                f"({s['saved_bytes'] / 1e6:.1f} MB saved by content dedupe)")
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,133 @@
+import os
+import numpy as np
+import pandas as pd
+from dataset_io import COLUMNS, load_dataset, save_dataset, to_typed_frame
+
+# MovieRecord attribute for each card / dataset column
+FIELDS = {
+    "Title": "title",
+    "Runtime (min)": "runtime",
+    "IMDb Score": "imdb_score",
+    "Votes": "votes",
+    "IMDb ID": "imdb_id",
+    "Poster URL": "poster_url",
+}
+
+
+def _value(value):
+    """Plain Python value for a dataset cell, with pandas missing values as None."""
+    return None if value is None or value is pd.NA or (isinstance(value, float) and np.isnan(value)) else value
+
+
+class MovieRecord:
+    """One movie: its card fields plus a uint32-style genre bitmask."""
+
+    __slots__ = ("imdb_id", "title", "runtime", "imdb_score", "votes", "poster_url", "genre_mask")
+
+    def __init__(self, imdb_id, title=None, runtime=None, imdb_score=None, votes=None, poster_url=None,
+                 genre_mask=0):
+        self.imdb_id = imdb_id
+        self.title = title
+        self.runtime = runtime
+        self.imdb_score = imdb_score
+        self.votes = votes
+        self.poster_url = poster_url
+        self.genre_mask = genre_mask
+
+    @classmethod
+    def from_card(cls, card, genre_mask=0):
+        """Build a record from a parsed result card (see imdb_parsing.build_card)."""
+        return cls(**{attr: _value(card.get(column)) for column, attr in FIELDS.items()},
+                   genre_mask=int(genre_mask))
+
+    def __repr__(self):
+        return f"MovieRecord({self.imdb_id!r}, {self.title!r}, genre_mask={self.genre_mask:#x})"
+
+
+class MovieStore:
+    """
+    Movies indexed by IMDb ID.
+
+    Upserting a movie that is already stored ORs its genres into the stored
+    record and keeps the first card's fields, so a movie found by several
+    genre crawls ends up as one record carrying every genre.
+    """
+
+    def __init__(self, records=()):
+        self._records = {}
+        for record in records:
+            self.add(record)
+
+    def __len__(self):
+        return len(self._records)
+
+    def __contains__(self, imdb_id):
+        return imdb_id in self._records
+
+    def __iter__(self):
+        return iter(self._records.values())
+
+    def get(self, imdb_id):
+        return self._records.get(imdb_id)
+
+    def add(self, record):
+        """Insert a record, or merge its genres into the stored one; returns the stored record."""
+        stored = self._records.get(record.imdb_id)
+        if stored is None:
+            self._records[record.imdb_id] = record
+            return record
+        stored.genre_mask |= record.genre_mask
+        return stored
+
+    def upsert(self, card, genre_mask=0):
+        """Add a parsed result card tagged with a genre mask."""
+        stored = self._records.get(card["IMDb ID"])
+        if stored is None:
+            return self.add(MovieRecord.from_card(card, genre_mask))
+        stored.genre_mask |= int(genre_mask)
+        return stored
+
+    def add_cards(self, cards, genre_mask=0):
+        """Upsert a batch of cards from one genre crawl."""
+        for card in cards:
+            self.upsert(card, genre_mask)
+
+    def merge_genres(self, imdb_id, genre_mask):
+        """OR genres into a stored movie; returns False if the movie is not stored."""
+        stored = self._records.get(imdb_id)
+        if stored is None:
+            return False
+        stored.genre_mask |= int(genre_mask)
+        return True
+
+    def remove(self, imdb_id):
+        return self._records.pop(imdb_id, None)
+
+    @classmethod
+    def from_frame(cls, df):
+        """Build a store from a dataset frame (see dataset_io.to_typed_frame)."""
+        df = to_typed_frame(df)
+        store = cls()
+        columns = [df[column].tolist() for column in FIELDS]
+        for *values, mask in zip(*columns, df["Genre Mask"].tolist()):
+            store.add(MovieRecord(**{attr: _value(v) for attr, v in zip(FIELDS.values(), values)},
+                                  genre_mask=int(mask)))
+        return store
+
+    def to_frame(self):
+        """Return the stored movies as a typed dataset frame."""
+        records = list(self._records.values())
+        data = {column: [getattr(r, attr) for r in records] for column, attr in FIELDS.items()}
+        data["Genre Mask"] = np.fromiter((r.genre_mask for r in records), dtype=np.uint32, count=len(records))
+        return to_typed_frame(pd.DataFrame(data, columns=[c for c in COLUMNS if c != "Genre"]))
+
+    @classmethod
+    def load(cls, path):
+        """Load a CSV or Parquet dataset; a missing path gives an empty store."""
+        if not os.path.exists(path):
+            return cls()
+        return cls.from_frame(load_dataset(path))
+
+    def save(self, path, partition_cols=None):
+        """Save the store as CSV or Parquet (see dataset_io.save_dataset)."""
+        save_dataset(self.to_frame(), path, partition_cols)
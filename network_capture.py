@@ -0,0 +1,109 @@
+import re
+import json
+
+# Requests the crawl never needs: images, fonts, media, ads and trackers
+BLOCKED_URL_PATTERNS = [
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.m3u8", "*.ts",
+    "*doubleclick.net*", "*googlesyndication.com*", "*google-analytics.com*", "*googletagmanager.com*",
+    "*amazon-adsystem.com*", "*fls-na.amazon.com*", "*unagi.amazon.com*", "*adsymptotic.com*",
+    "*scorecardresearch.com*", "*quantserve.com*", "*facebook.net*", "*criteo.com*",
+]
+
+# IMDb's search page fetches each "show more" batch from its GraphQL API
+GRAPHQL_URL_RE = re.compile(r'graphql\.imdb\.com')
+NEXT_DATA_RE = re.compile(r'<script[^>]*id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.S)
+
+
+def capture_options(options):
+    """Ask chromedriver to log network events so responses can be read back."""
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return options
+
+def enable_network_capture(driver):
+    """Turn on CDP network events and block heavy or third-party requests."""
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+
+def captured_graphql_payloads(driver):
+    """Return the JSON bodies of GraphQL responses since the last call (drains the performance log)."""
+    payloads = []
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+        if message.get("method") != "Network.responseReceived":
+            continue
+        params = message["params"]
+        if not GRAPHQL_URL_RE.search(params["response"]["url"]):
+            continue
+        try:
+            body = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": params["requestId"]})
+            payloads.append(json.loads(body["body"]))
+        except Exception as e:
+            print(f"Error reading GraphQL response {params['requestId']}: {e}")
+    return payloads
+
+
+def _find_key(data, key):
+    """Yield every value stored under `key` anywhere in a JSON document."""
+    if isinstance(data, dict):
+        for k, v in data.items():
+            if k == key:
+                yield v
+            else:
+                yield from _find_key(v, key)
+    elif isinstance(data, list):
+        for item in data:
+            yield from _find_key(item, key)
+
+def _text(value):
+    return value.get("text") if isinstance(value, dict) else value
+
+def record_from_title(title):
+    """Build a card record from one title object (__NEXT_DATA__ list item or GraphQL node)."""
+    runtime = title.get("runtime")
+    seconds = runtime.get("seconds") if isinstance(runtime, dict) else runtime
+    rating = title.get("ratingSummary") or title.get("ratingsSummary") or {}
+    image = title.get("primaryImage") or {}
+    return {
+        "Title": _text(title.get("titleText")),
+        "Runtime (min)": seconds // 60 if seconds else None,
+        "IMDb Score": rating.get("aggregateRating"),
+        "Votes": rating.get("voteCount") or None,
+        "IMDb ID": title.get("titleId") or title.get("id"),
+        "Poster URL": image.get("url"),
+    }
+
+def records_from_next_data(page_source):
+    """Records for the first page of results, embedded in the page's __NEXT_DATA__ JSON."""
+    match = NEXT_DATA_RE.search(page_source)
+    if not match:
+        return []
+    records = []
+    for items in _find_key(json.loads(match.group(1)), "titleListItems"):
+        records.extend(record_from_title(item) for item in items)
+    return records
+
+def records_from_graphql(payload):
+    """Records for one "show more" batch from an AdvancedTitleSearch GraphQL response."""
+    records = []
+    for search in _find_key(payload, "advancedTitleSearch"):
+        for edge in search.get("edges", []):
+            node = edge.get("node", {})
+            records.append(record_from_title(node.get("title", node)))
+    return records
+
+def merge_records(*record_lists):
+    """Concatenate record lists, keeping the first record per IMDb ID."""
+    seen, merged = set(), []
+    for records in record_lists:
+        for record in records:
+            if record["IMDb ID"] not in seen:
+                seen.add(record["IMDb ID"])
+                merged.append(record)
+    return merged
+
+def extract_cards_from_network(driver):
+    """Build result cards from the page's embedded JSON plus every captured GraphQL batch."""
+    batches = [records_from_graphql(payload) for payload in captured_graphql_payloads(driver)]
+    return merge_records(records_from_next_data(driver.page_source), *batches)
@@ -0,0 +1,76 @@
+import time
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from imdb_parsing import RESULTS_XPATH
+from run_metrics import metrics
+
+# Number of result cards currently on the page, in one round trip
+COUNT_RESULTS_JS = """
+return document.evaluate(arguments[0], document, null,
+                         XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;
+"""
+
+# The "<n> more" button, i.e. the first ' more' span whose text contains a number
+FIND_MORE_JS = """
+const spans = document.evaluate("//span[contains(text(), ' more')]", document, null,
+                                XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+for (let i = 0; i < spans.snapshotLength; i++) {
+    const span = spans.snapshotItem(i);
+    if (/\\d/.test(span.textContent)) return span;
+}
+return null;
+"""
+
+
+def count_results(driver):
+    """Return how many result cards are loaded."""
+    return driver.execute_script(COUNT_RESULTS_JS, RESULTS_XPATH)
+
+def results_above(count):
+    """Wait condition: the result count once it exceeds `count`."""
+    def condition(driver):
+        new_count = count_results(driver)
+        return new_count if new_count > count else None
+    return condition
+
+def wait_for(driver, condition, timeout, poll):
+    """Wait until condition(driver) is truthy; return its value, or None on timeout."""
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=poll).until(condition)
+    except TimeoutException:
+        return None
+
+def paginate(driver, max_clicks, timeout=10, button_timeout=3, poll=0.1):
+    """
+    Click "show more" up to max_clicks times, waiting on the result count instead of fixed sleeps.
+
+    Each click waits until more result cards are on the page, and pagination
+    stops as soon as the button is gone or a click brings nothing new.
+    Returns (final result count, per-click latencies in seconds).
+    """
+    # Page is ready once the first results are rendered
+    if not wait_for(driver, count_results, timeout, poll):
+        print("No results loaded")
+        return 0, []
+
+    count = count_results(driver)
+    latencies = []
+    for i in range(max_clicks):
+        button = wait_for(driver, lambda d: d.execute_script(FIND_MORE_JS), button_timeout, poll)
+        if button is None:
+            print(f"No more results after {count} titles")
+            break
+
+        start = time.perf_counter()
+        driver.execute_script("arguments[0].click();", button)
+        new_count = wait_for(driver, results_above(count), timeout, poll)
+        latency = time.perf_counter() - start
+        metrics.observe("more_click", latency, ok=new_count is not None)
+        if new_count is None:
+            print(f"Click {i + 1}: no new results after {latency:.2f}s, stopping at {count} titles")
+            break
+
+        latencies.append(latency)
+        print(f"Click {i + 1}: {new_count - count} new results in {latency:.2f}s ({new_count} total)")
+        count = new_count
+    return count, latencies
@@ -0,0 +1,176 @@
+import os
+import re
+import sqlite3
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from media_store import link_file
+from run_metrics import metrics
+
+# IMDb (m.media-amazon.com) image URLs end in ._V1_<modifiers>.<ext>; the modifiers pick size, crop and quality
+IMAGE_MODIFIERS_RE = re.compile(r'\._V1_(?P<modifiers>[^/]*?)(?P<ext>\.\w+)$')
+# UX/SX scale to a width, UY/SY to a height, CR<x>,<y>,<w>,<h> crops the scaled image
+SIZE_MODIFIER_RE = re.compile(r'^(UX|UY|SX|SY|CR)(\d+(?:,\d+)*)$')
+
+CHUNK_SIZE = 64 * 1024
+
+
+def resize_poster_url(poster_url, width=300, quality=75):
+    """
+    Return (url, scale) for a poster at most `width` pixels wide.
+
+    Full-size URLs (no size modifier) are scaled to `width`. URLs already sized
+    wider are scaled down with their crop kept; narrower ones, such as the
+    140px search thumbnails, are left as they are. `scale` is the new width over
+    the old one: 1.0 when the URL is unchanged, None when the old width is unknown.
+    """
+    match = IMAGE_MODIFIERS_RE.search(poster_url) if poster_url else None
+    if match is None:
+        return poster_url, 1.0
+    modifiers = [m for m in match.group("modifiers").split("_") if m]
+    sizes = {}
+    for modifier in modifiers:
+        size = SIZE_MODIFIER_RE.match(modifier)
+        if size:
+            sizes[size.group(1)] = [int(v) for v in size.group(2).split(",")]
+    if not sizes:
+        url = f"{poster_url[:match.start()]}._V1_QL{quality}_UX{width}_{match.group('ext')}"
+        return url, None
+
+    current = sizes["CR"][2] if "CR" in sizes else (sizes.get("UX") or sizes.get("SX") or [None])[0]
+    if current is None or current <= width:
+        return poster_url, 1.0
+    scale = width / current
+    resized = [f"QL{quality}"]
+    for modifier in modifiers:
+        size = SIZE_MODIFIER_RE.match(modifier)
+        if size:
+            resized.append(size.group(1) + ",".join(str(round(v * scale)) for v in sizes[size.group(1)]))
+        elif not modifier.startswith("QL"):
+            resized.append(modifier)
+    return f"{poster_url[:match.start()]}._V1_{'_'.join(resized)}_{match.group('ext')}", scale
+
+def sized_poster_url(poster_url, width=300, quality=75):
+    """Ask IMDb's image server for a poster at most `width` pixels wide; other URLs are returned unchanged."""
+    return resize_poster_url(poster_url, width, quality)[0]
+
+
+class PosterFetcher:
+    """
+    Poster downloads at a target width, streamed to disk in chunks.
+
+    ETag and Last-Modified of every poster fetched are kept in SQLite with
+    the file they were saved to. When that file still exists, later runs send
+    a conditional GET and on 304 reuse it instead of downloading it again.
+    """
+
+    def __init__(self, validators_path="poster_validators.sqlite", width=300, quality=75, max_workers=4,
+                 timeout=10):
+        self.width = width
+        self.quality = quality
+        self.timeout = timeout
+        self.downloaded = 0
+        self.downloaded_bytes = 0
+        self.resized_bytes_saved = 0
+        self.resized_full_size = 0
+        self.not_modified = 0
+        self.not_modified_bytes = 0
+        self.lock = threading.Lock()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.conn = sqlite3.connect(validators_path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS posters ("
+            "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, path TEXT NOT NULL, size INTEGER NOT NULL)"
+        )
+        self.conn.commit()
+
+    def _validators(self, url):
+        with self.lock:
+            return self.conn.execute(
+                "SELECT etag, last_modified, path, size FROM posters WHERE url = ?", (url,)
+            ).fetchone()
+
+    def fetch(self, poster_url, dest):
+        """Download the sized poster to dest; returns False if an unchanged earlier copy was reused."""
+        url, scale = resize_poster_url(poster_url, self.width, self.quality)
+        headers = {}
+        known = self._validators(url)
+        if known is not None and os.path.exists(known[2]):
+            etag, last_modified, _, _ = known
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        with self.session.get(url, headers=headers, stream=True, timeout=self.timeout) as response:
+            if response.status_code == 304:
+                if os.path.abspath(known[2]) != os.path.abspath(dest):
+                    link_file(known[2], dest)
+                with self.lock:
+                    self.not_modified += 1
+                    self.not_modified_bytes += known[3]
+                metrics.count("poster_fetch", "not modified")
+                return False
+            response.raise_for_status()
+
+            # Write to a temporary name so an interrupted download never looks like a poster
+            os.makedirs(os.path.dirname(dest) or ".", exist_ok=True)
+            partial = dest + ".part"
+            size = 0
+            try:
+                with open(partial, "wb") as f:
+                    for chunk in response.iter_content(CHUNK_SIZE):
+                        f.write(chunk)
+                        size += len(chunk)
+                os.replace(partial, dest)
+            finally:
+                if os.path.exists(partial):
+                    os.remove(partial)
+
+        metrics.add_bytes("poster", size)
+        with self.lock:
+            self.downloaded += 1
+            self.downloaded_bytes += size
+            # JPEG size roughly follows the pixel count, so the URL as given would have cost size / scale²
+            if scale is None:
+                self.resized_full_size += 1
+            elif scale < 1:
+                self.resized_bytes_saved += round(size / scale ** 2) - size
+            self.conn.execute(
+                "INSERT OR REPLACE INTO posters (url, etag, last_modified, path, size) VALUES (?, ?, ?, ?, ?)",
+                (url, response.headers.get("ETag"), response.headers.get("Last-Modified"), dest, size),
+            )
+            self.conn.commit()
+        return True
+
+    def stats(self):
+        """Return this session's download, resize and 304 counters."""
+        return {
+            "downloaded": self.downloaded,
+            "downloaded_bytes": self.downloaded_bytes,
+            "resized_bytes_saved": self.resized_bytes_saved,
+            "resized_full_size": self.resized_full_size,
+            "not_modified": self.not_modified,
+            "not_modified_bytes": self.not_modified_bytes,
+        }
+
+    def report(self):
+        s = self.stats()
+        sizing = f"~{s['resized_bytes_saved'] / 1e6:.1f} MB saved by sizing"
+        if s["resized_full_size"]:
+            sizing += f", plus {s['resized_full_size']} scaled down from full size"
+        return (f"Posters: {s['downloaded']} downloaded at up to {self.width}px ({s['downloaded_bytes'] / 1e6:.1f} MB, "
+                f"{sizing}), {s['not_modified']} unchanged and reused ({s['not_modified_bytes'] / 1e6:.1f} MB saved)")
+
+    def close(self):
+        self.session.close()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,120 @@
+import json
+import math
+import time
+import threading
+from contextlib import contextmanager
+from collections import defaultdict
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, math.ceil(q / 100 * len(sorted_values)) - 1)
+    return sorted_values[rank]
+
+
+class Metrics:
+    """
+    Timers, counters and byte totals for one run, optionally written as JSON lines.
+
+    Every observation is kept in memory for the end-of-run summary and, once
+    `open(path)` is called, also appended to that file as one JSON object per
+    line: {"ts", "event": "timing" | "count" | "bytes", "stage", ...fields}.
+    Safe to use from any thread.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.file = None
+        self.timings = defaultdict(list)
+        self.failures = defaultdict(int)
+        self.counts = defaultdict(int)
+        self.bytes = defaultdict(int)
+
+    def reset(self):
+        """Forget everything observed so far (the output file, if any, stays open)."""
+        with self.lock:
+            self.timings.clear()
+            self.failures.clear()
+            self.counts.clear()
+            self.bytes.clear()
+
+    def open(self, path):
+        """Start writing events to a JSON-lines file (appending)."""
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+            self.file = open(path, "a", encoding="utf-8")
+
+    def _emit(self, event, stage, fields):
+        if self.file is not None:
+            self.file.write(json.dumps({"ts": time.time(), "event": event, "stage": stage, **fields}) + "\n")
+
+    def observe(self, stage, seconds, ok=True, **fields):
+        """Record how long one call of a stage took."""
+        with self.lock:
+            self.timings[stage].append(seconds)
+            if not ok:
+                self.failures[stage] += 1
+            self._emit("timing", stage, dict(fields, seconds=round(seconds, 6), ok=ok))
+
+    @contextmanager
+    def timer(self, stage, **fields):
+        """Time the enclosed block as one call of `stage`; an exception marks it failed and propagates."""
+        start = time.perf_counter()
+        ok = False
+        try:
+            yield fields
+            ok = True
+        finally:
+            self.observe(stage, time.perf_counter() - start, ok, **fields)
+
+    def count(self, stage, reason="ok", n=1, **fields):
+        """Count an outcome of a stage, e.g. count("lookup", "no trailer")."""
+        with self.lock:
+            self.counts[(stage, reason)] += n
+            self._emit("count", stage, dict(fields, reason=reason, n=n))
+
+    def add_bytes(self, stage, n_bytes, **fields):
+        """Add to the bytes a stage downloaded."""
+        with self.lock:
+            self.bytes[stage] += n_bytes
+            self._emit("bytes", stage, dict(fields, bytes=n_bytes))
+
+    def summary(self):
+        """Per-stage calls, failures and p50/p95/total seconds, plus counts and bytes."""
+        with self.lock:
+            stages = {}
+            for stage, values in self.timings.items():
+                values = sorted(values)
+                stages[stage] = {
+                    "calls": len(values),
+                    "failed": self.failures[stage],
+                    "p50": percentile(values, 50),
+                    "p95": percentile(values, 95),
+                    "total": sum(values),
+                }
+            return {"stages": stages, "counts": dict(self.counts), "bytes": dict(self.bytes)}
+
+    def report(self):
+        s = self.summary()
+        lines = [f"  {'stage':<18} {'calls':>6} {'failed':>6} {'p50':>8} {'p95':>8} {'total':>9}"]
+        for stage, t in sorted(s["stages"].items(), key=lambda item: -item[1]["total"]):
+            lines.append(f"  {stage:<18} {t['calls']:>6} {t['failed']:>6} {t['p50']:>7.2f}s {t['p95']:>7.2f}s "
+                         f"{t['total']:>8.1f}s")
+        for (stage, reason), n in sorted(s["counts"].items()):
+            lines.append(f"  {stage}: {reason} = {n}")
+        for stage, n_bytes in sorted(s["bytes"].items()):
+            lines.append(f"  {stage}: {n_bytes / 1e6:.1f} MB downloaded")
+        return "Run metrics:\n" + "\n".join(lines)
+
+    def close(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+
+# Shared instance the scraper modules report to
+metrics = Metrics()
@@ -0,0 +1,44 @@
+import time
+import sqlite3
+import threading
+
+
+class SeenIds:
+    """
+    On-disk record of every IMDb ID each genre's crawls into one data folder returned.
+
+    Delta crawls count these as known along with the rows already in that
+    folder's dataset, so new releases that were scraped but dropped (no
+    trailer, no poster, failed download) don't keep a newest-first crawl
+    paginating.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen ("
+            "genre_id INTEGER NOT NULL, imdb_id TEXT NOT NULL, first_seen REAL NOT NULL, "
+            "PRIMARY KEY (genre_id, imdb_id)) WITHOUT ROWID"
+        )
+        self.conn.commit()
+
+    def ids(self, genre_id):
+        """Return the set of IMDb IDs ever crawled for a genre."""
+        with self.lock:
+            rows = self.conn.execute("SELECT imdb_id FROM seen WHERE genre_id = ?", (genre_id,))
+            return {imdb_id for imdb_id, in rows}
+
+    def add(self, genre_id, imdb_ids):
+        """Record IMDb IDs a crawl of the genre returned; already known ones keep their first_seen."""
+        now = time.time()
+        with self.lock:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO seen (genre_id, imdb_id, first_seen) VALUES (?, ?, ?)",
+                ((genre_id, imdb_id, now) for imdb_id in imdb_ids),
+            )
+            self.conn.commit()
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,124 @@
+import time
+from imdb_parsing import RESULTS_XPATH, parse_card_fragments
+from pagination import FIND_MORE_JS, count_results, wait_for
+
+# Serialize the loaded result cards and remove them from the DOM, in one round trip
+TAKE_RESULTS_JS = """
+const items = document.evaluate(arguments[0], document, null,
+                                XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const html = [];
+for (let i = 0; i < items.snapshotLength; i++) {
+    const item = items.snapshotItem(i);
+    html.push(item.outerHTML);
+    item.remove();
+}
+return html;
+"""
+
+MB = 1024 * 1024
+
+
+def take_result_fragments(driver):
+    """Return the outerHTML of every loaded result card, removing the cards from the page."""
+    return driver.execute_script(TAKE_RESULTS_JS, RESULTS_XPATH)
+
+def browser_metrics(driver):
+    """Return Chrome's current JS heap size (bytes) and DOM node count."""
+    metrics = driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+    values = {m["name"]: m["value"] for m in metrics}
+    return values.get("JSHeapUsedSize", 0), values.get("Nodes", 0)
+
+
+class StreamStats:
+    """Per-batch extraction time and peak browser memory of a streaming crawl."""
+
+    def __init__(self):
+        self.batches = 0
+        self.cards = 0
+        self.batch_seconds = []
+        self.peak_heap = 0
+        self.peak_nodes = 0
+
+    def observe(self, cards, seconds, heap, nodes):
+        self.batches += 1
+        self.cards += cards
+        self.batch_seconds.append(seconds)
+        self.peak_heap = max(self.peak_heap, heap)
+        self.peak_nodes = max(self.peak_nodes, nodes)
+
+    def merge(self, other):
+        self.batches += other.batches
+        self.cards += other.cards
+        self.batch_seconds.extend(other.batch_seconds)
+        self.peak_heap = max(self.peak_heap, other.peak_heap)
+        self.peak_nodes = max(self.peak_nodes, other.peak_nodes)
+
+    def report(self):
+        avg = sum(self.batch_seconds) / len(self.batch_seconds) if self.batch_seconds else 0.0
+        worst = max(self.batch_seconds, default=0.0)
+        return (f"{self.cards} cards in {self.batches} batches, batch extraction avg={avg * 1000:.0f}ms "
+                f"max={worst * 1000:.0f}ms, peak JS heap {self.peak_heap / MB:.1f} MB, "
+                f"peak DOM nodes {int(self.peak_nodes)}")
+
+
+def stream_batches(driver, max_clicks, timeout=10, button_timeout=3, poll=0.1, stats=None):
+    """
+    Yield lists of result cards, one per batch, while clicking "show more" up to max_clicks times.
+
+    After every click the newly appended cards are parsed and removed from the
+    page, so the DOM only ever holds one batch and the cost of each extraction
+    stays flat however many titles are loaded. Cards are deduplicated by IMDb
+    ID in case the page re-renders ones already taken. The next click only
+    happens when the caller asks for the next batch, so closing the generator
+    stops pagination.
+    """
+    stats = stats if stats is not None else StreamStats()
+    driver.execute_cdp_cmd("Performance.enable", {})
+    if not wait_for(driver, count_results, timeout, poll):
+        print("No results loaded")
+        return
+
+    seen = set()
+    for i in range(max_clicks + 1):
+        start = time.perf_counter()
+        cards = [card for card in parse_card_fragments(take_result_fragments(driver))
+                 if card["IMDb ID"] not in seen]
+        seconds = time.perf_counter() - start
+        seen.update(card["IMDb ID"] for card in cards)
+        stats.observe(len(cards), seconds, *browser_metrics(driver))
+        yield cards
+
+        if i == max_clicks:
+            break
+        button = wait_for(driver, lambda d: d.execute_script(FIND_MORE_JS), button_timeout, poll)
+        if button is None:
+            print(f"No more results after {len(seen)} titles")
+            break
+        driver.execute_script("arguments[0].click();", button)
+        # Every taken card is gone, so any card on the page is a new one
+        if not wait_for(driver, count_results, timeout, poll):
+            print(f"Click {i + 1}: no new results after {timeout}s, stopping at {len(seen)} titles")
+            break
+
+def stream_cards(driver, max_clicks, timeout=10, button_timeout=3, poll=0.1, stats=None):
+    """Yield result cards one by one as stream_batches takes them off the page."""
+    for batch in stream_batches(driver, max_clicks, timeout, button_timeout, poll, stats):
+        yield from batch
+
+def delta_cards(driver, max_clicks, known_ids, timeout=10, button_timeout=3, poll=0.1, stats=None):
+    """
+    Collect cards from a newest-first search until a whole batch is already known.
+
+    known_ids supports `in` (a set, MovieStore, ...). The batch that is
+    entirely known ends the crawl without another "show more" click.
+    """
+    cards = []
+    batches = stream_batches(driver, max_clicks, timeout, button_timeout, poll, stats)
+    for clicks, batch in enumerate(batches):
+        cards.extend(batch)
+        if batch and all(card["IMDb ID"] in known_ids for card in batch):
+            print(f"Delta crawl: batch {clicks + 1} is all known titles, stopping after {clicks} clicks "
+                  f"({len(cards)} titles)")
+            batches.close()
+            break
+    return cards
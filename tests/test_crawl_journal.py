@@ -0,0 +1,77 @@
+import json
+
+from crawl_journal import (CrawlJournal, SCRAPED, TRAILER_RESOLVED, AUDIO_DONE, POSTER_DONE, COMMITTED,
+                           DROPPED)
+
+
+def test_replay_ignores_torn_last_line(tmp_path):
+    path = tmp_path / "crawl_journal.jsonl"
+    journal = CrawlJournal(str(path))
+    journal.record_genre(3, [{"IMDb ID": "tt0000001"}, {"IMDb ID": "tt0000002"}])
+    journal.record(TRAILER_RESOLVED, "tt0000001", trailer_url="https://youtu.be/a")
+    journal.file.close()
+    # Crash halfway through writing an event
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"event": "audio_done", "imdb_')
+
+    journal = CrawlJournal(str(path))
+    assert journal.genres_done == {3}
+    assert [card["IMDb ID"] for card in journal.cards_by_genre[3]] == ["tt0000001", "tt0000002"]
+    assert journal.state("tt0000001") == TRAILER_RESOLVED
+    assert journal.trailer_urls["tt0000001"] == "https://youtu.be/a"
+
+    # The next event starts on its own line and survives another replay
+    journal.record(AUDIO_DONE, "tt0000001")
+    journal.file.close()
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert json.loads(lines[-1])["event"] == AUDIO_DONE
+    assert CrawlJournal(str(path)).state("tt0000001") == AUDIO_DONE
+
+
+def test_unfinished_genre_is_not_done(tmp_path):
+    path = tmp_path / "crawl_journal.jsonl"
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"event": "genre_started", "genre": 5}) + "\n")
+        f.write(json.dumps({"event": SCRAPED, "genre": 5, "card": {"IMDb ID": "tt0000001"}}) + "\n")
+
+    journal = CrawlJournal(str(path))
+    assert journal.genres_done == set()
+    # Scraping the genre again starts its cards over
+    journal.record_genre(5, [{"IMDb ID": "tt0000009"}])
+    assert journal.genres_done == {5}
+    assert journal.cards_by_genre[5] == [{"IMDb ID": "tt0000009"}]
+
+
+def test_reached_follows_state_order(tmp_path):
+    journal = CrawlJournal(str(tmp_path / "crawl_journal.jsonl"))
+    journal.record(AUDIO_DONE, "tt0000001")
+
+    assert journal.reached("tt0000001", SCRAPED)
+    assert journal.reached("tt0000001", TRAILER_RESOLVED)
+    assert journal.reached("tt0000001", AUDIO_DONE)
+    assert not journal.reached("tt0000001", POSTER_DONE)
+    assert not journal.reached("tt0000001", COMMITTED)
+    assert not journal.reached("tt0000002", SCRAPED)
+
+
+def test_dropped_movie_reaches_nothing(tmp_path):
+    path = tmp_path / "crawl_journal.jsonl"
+    journal = CrawlJournal(str(path))
+    journal.record(TRAILER_RESOLVED, "tt0000001", trailer_url="https://youtu.be/a")
+    journal.record(DROPPED, "tt0000001")
+
+    for journal in (journal, CrawlJournal(str(path))):
+        assert journal.state("tt0000001") == DROPPED
+        assert not journal.reached("tt0000001", SCRAPED)
+        assert not journal.reached("tt0000001", TRAILER_RESOLVED)
+
+
+def test_finish_sets_journal_aside(tmp_path):
+    path = tmp_path / "crawl_journal.jsonl"
+    journal = CrawlJournal(str(path))
+    journal.record(COMMITTED, "tt0000001")
+    journal.finish()
+
+    assert not path.exists()
+    assert (tmp_path / "crawl_journal.jsonl.done").exists()
+    assert CrawlJournal(str(path)).state("tt0000001") is None
@@ -0,0 +1,70 @@
+import math
+import random
+
+import pandas as pd
+import pytest
+
+from imdb_parsing import (parse_runtime, parse_votes, parse_imdb_score,
+                          parse_runtime_batch, parse_votes_batch, parse_imdb_score_batch)
+
+INT64_MAX = 2 ** 63 - 1
+
+# Pieces of realistic card text mixed with the junk the batch parsers must treat like the scalar ones
+PIECES = ["1", "2", "5", "9", "0", "00", "12", "999", "9" * 20, ".", "..", "_", "h", "m", " ", "K", "M",
+          "(", ")", ",", "-", "+", "e", "E", "e5", "inf", "nan", "Infinity", "x", "\t", "\x0b", "\x1f",
+          "\xa0", "١", "٢", "²", "é", " "]
+
+
+def random_text(rng):
+    if rng.random() < 0.05:
+        return rng.choice([None, float("nan"), 5, ""])
+    return "".join(rng.choice(PIECES) for _ in range(rng.randint(1, 6)))
+
+
+def expected(scalar, value):
+    """Scalar result with the batch parsers' rules: missing/non-str and values that don't fit Int64 give None."""
+    if not isinstance(value, str):
+        return None
+    try:
+        result = scalar(value)
+    except OverflowError:
+        return None
+    if isinstance(result, int) and abs(result) > INT64_MAX:
+        return None
+    return result
+
+
+def same(e, g):
+    if e is None or g is None:
+        return e is None and g is None
+    if isinstance(e, float) and math.isnan(e):
+        return math.isnan(g)
+    return e == g and isinstance(e, float) == isinstance(g, float)
+
+
+CASES = [
+    (parse_runtime, parse_runtime_batch, ["1h 40m", "40m", "2h", "1990", "0h 0m", "9" * 25 + "h", "١h ٢m"]),
+    (parse_votes, parse_votes_batch, ["(24K)", " (1.9M)", "1,234", "-5", "+1_0", "1e3K", "9" * 25, "1e30M",
+                                      "infK", "nanM", "-9223372036854775808", "9223372036854775807", "K"]),
+    (parse_imdb_score, parse_imdb_score_batch, ["7.5", "10", ".5", "5.", "1.2.3", "9" * 400, "١.5", "²"]),
+]
+
+
+@pytest.mark.parametrize("scalar, batch, samples", CASES, ids=["runtime", "votes", "score"])
+def test_batch_matches_scalar(scalar, batch, samples):
+    rng = random.Random(0)
+    values = samples + [None, ""] + [random_text(rng) for _ in range(20_000)]
+    got = [None if pd.isna(v) else v for v in batch(values).tolist()]
+    for value, g in zip(values, got):
+        e = expected(scalar, value)
+        assert same(e, g), f"{value!r}: scalar {e!r}, batch {g!r}"
+
+
+def test_batch_keeps_index_and_dtype():
+    values = pd.Series(["(1.9M)", None], index=[7, 3])
+    result = parse_votes_batch(values)
+    assert result.dtype == "Int64"
+    assert result.index.tolist() == [7, 3]
+    assert result.tolist() == [1900000, pd.NA]
+    assert parse_imdb_score_batch(["7.5"]).dtype == "Float64"
+    assert parse_runtime_batch([]).dtype == "Int64"
@@ -0,0 +1,58 @@
+import random
+import threading
+import time
+
+from media_pipeline import Pipeline, Stage
+
+
+def test_results_come_back_in_input_order_and_drops_reach_on_drop():
+    rng = random.Random(0)
+    dropped = []
+
+    def jitter(job):
+        time.sleep(rng.random() / 200)
+        return job
+
+    def keep_even(job):
+        return job if job["n"] % 2 == 0 else None
+
+    pipeline = Pipeline([Stage("jitter", jitter, 4), Stage("even", keep_even, 3), Stage("jitter2", jitter, 2)],
+                        queue_size=2, on_drop=dropped.append)
+    results = pipeline.run([{"n": n} for n in range(50)])
+
+    assert [job["n"] for job in results] == list(range(0, 50, 2))
+    assert sorted(job["n"] for job in dropped) == list(range(1, 50, 2))
+    assert pipeline.completed == 25
+    assert pipeline.stages[1].dropped == 25
+
+
+def test_exceptions_drop_the_job():
+    dropped = []
+
+    def fail_on_three(job):
+        if job["n"] == 3:
+            raise RuntimeError("boom")
+        return job
+
+    results = Pipeline([Stage("flaky", fail_on_three, 2)], on_drop=dropped.append).run([{"n": n} for n in range(6)])
+
+    assert [job["n"] for job in results] == [0, 1, 2, 4, 5]
+    assert [job["n"] for job in dropped] == [3]
+
+
+def test_failing_on_drop_does_not_hang_the_run():
+    def broken_cleanup(job):
+        raise OSError("cleanup failed")
+
+    # One worker and tiny queues: a worker killed by the cleanup error would block the producer forever
+    pipeline = Pipeline([Stage("drop", lambda job: None, 1), Stage("keep", lambda job: job, 1)],
+                        queue_size=1, on_drop=broken_cleanup)
+    results = []
+    runner = threading.Thread(target=lambda: results.append(pipeline.run([{"n": n} for n in range(20)])),
+                              daemon=True)
+    runner.start()
+    runner.join(timeout=10)
+
+    assert not runner.is_alive()
+    assert results == [[]]
+    assert pipeline.stages[0].dropped == 20
@@ -0,0 +1,99 @@
+import os
+import subprocess
+
+import pytest
+
+import media_pipeline
+from media_store import AUDIO, POSTER, MediaStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = MediaStore(str(tmp_path / "media_store"))
+    yield store
+    store.close()
+
+
+def write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+    return str(path)
+
+
+def read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_adopt_moves_file_into_store_and_links_it_back(store, tmp_path):
+    path = write(tmp_path / "run" / "tt0000001.jpg", b"poster one")
+    obj = store.adopt("tt0000001", POSTER, path)
+
+    assert obj.startswith(os.path.join(store.root, "objects"))
+    assert read(obj) == read(path) == b"poster one"
+    assert store.lookup("tt0000001", POSTER) == obj
+    assert store.lookup("tt0000001", AUDIO) is None
+    assert store.stats()["added"] == 1
+
+
+def test_adopt_dedupes_identical_content(store, tmp_path):
+    first = store.adopt("tt0000001", POSTER, write(tmp_path / "a" / "tt0000001.jpg", b"same bytes"))
+    second_path = write(tmp_path / "b" / "tt0000002.jpg", b"same bytes")
+    second = store.adopt("tt0000002", POSTER, second_path)
+
+    assert second == first
+    assert read(second_path) == b"same bytes"
+    stats = store.stats()
+    assert (stats["added"], stats["deduped"], stats["deduped_bytes"]) == (1, 1, len(b"same bytes"))
+    assert (stats["entries"], stats["objects"], stats["saved_bytes"]) == (2, 1, len(b"same bytes"))
+
+
+def test_link_places_stored_file(store, tmp_path):
+    store.adopt("tt0000001", POSTER, write(tmp_path / "a" / "tt0000001.jpg", b"poster"))
+    dest = str(tmp_path / "b" / "tt0000001.jpg")
+
+    assert store.link("tt0000001", POSTER, dest)
+    assert read(dest) == b"poster"
+    assert not store.link("tt0000002", POSTER, str(tmp_path / "b" / "tt0000002.jpg"))
+    assert not os.path.exists(tmp_path / "b" / "tt0000002.jpg")
+    assert store.stats()["reused"] == 1
+
+
+def fake_run(ffmpeg_output, ffmpeg_fails=False):
+    """Stand-in for subprocess.run: ffprobe reports opus, ffmpeg writes `ffmpeg_output` to its last argument."""
+    def run(args, **kwargs):
+        if args[0] == "ffprobe":
+            return subprocess.CompletedProcess(args, 0, stdout="opus\n", stderr="")
+        with open(args[-1], "wb") as f:
+            f.write(ffmpeg_output)
+        if ffmpeg_fails:
+            raise subprocess.CalledProcessError(1, args)
+        return subprocess.CompletedProcess(args, 0)
+    return run
+
+
+def test_transcode_over_store_link_leaves_object_untouched(store, tmp_path, monkeypatch):
+    audio_file = write(tmp_path / "run" / "tt0000001.opus", b"stored audio")
+    obj = store.adopt("tt0000001", AUDIO, audio_file)
+    source = write(tmp_path / "run" / "tt0000001.source.webm", b"new download")
+    monkeypatch.setattr(media_pipeline.subprocess, "run", fake_run(b"transcoded audio"))
+
+    media_pipeline.transcode_to_opus(source, audio_file)
+
+    assert read(obj) == b"stored audio"
+    assert read(audio_file) == b"transcoded audio"
+    assert sorted(os.listdir(tmp_path / "run")) == ["tt0000001.opus", "tt0000001.source.webm"]
+
+
+def test_failed_transcode_over_store_link_leaves_both_files(store, tmp_path, monkeypatch):
+    audio_file = write(tmp_path / "run" / "tt0000001.opus", b"stored audio")
+    obj = store.adopt("tt0000001", AUDIO, audio_file)
+    source = write(tmp_path / "run" / "tt0000001.source.webm", b"new download")
+    monkeypatch.setattr(media_pipeline.subprocess, "run", fake_run(b"half written", ffmpeg_fails=True))
+
+    with pytest.raises(subprocess.CalledProcessError):
+        media_pipeline.transcode_to_opus(source, audio_file)
+
+    assert read(obj) == read(audio_file) == b"stored audio"
+    assert sorted(os.listdir(tmp_path / "run")) == ["tt0000001.opus", "tt0000001.source.webm"]
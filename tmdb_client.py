@@ -0,0 +1,193 @@
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+import requests
+from requests.adapters import HTTPAdapter
+from run_metrics import metrics
+
+TMDB_API_BASE = "https://api.themoviedb.org/3"
+
+# TMDb allows roughly 50 requests per second per IP; stay a little under it
+TMDB_RATE_LIMIT = 40
+
+
+def pick_trailer_url(data):
+    """Return the first YouTube trailer URL in a TMDb /videos response, or None."""
+    for video in data.get("results", []):
+        if video["type"] == "Trailer" and video["site"] == "YouTube":
+            return f"https://www.youtube.com/watch?v={video['key']}"
+    return None
+
+def parse_retry_after(value, default=1.0):
+    """Convert a Retry-After header (seconds or HTTP date) to seconds to wait."""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return default
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, bursts up to `capacity`."""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class TMDbClient:
+    """
+    Pooled, rate-limited TMDb client for batch trailer lookups.
+
+    With an `id_index` (IMDb ID -> TMDb ID, see tmdb_id_index), each movie is
+    resolved locally and fetched with one /movie/{tmdb_id} call that appends
+    its videos; movies the index doesn't list are skipped without a request.
+    """
+
+    def __init__(self, api_token, base_url=TMDB_API_BASE, max_workers=8, rate=TMDB_RATE_LIMIT,
+                 max_retries=5, timeout=10, cache=None, id_index=None):
+        self.base_url = base_url.rstrip("/")
+        self.cache = cache
+        self.id_index = id_index
+        self.fetch_count = 0
+        self.fetch_seconds = 0.0
+        self.stats_lock = threading.Lock()
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.bucket = TokenBucket(rate)
+
+        # One keep-alive connection per worker thread
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "accept": "application/json",
+            "Authorization": api_token,
+        })
+
+    def _get(self, path, params=None):
+        """GET a TMDb endpoint, honoring 429 Retry-After and backing off on 5xx errors."""
+        url = f"{self.base_url}{path}"
+        for attempt in range(self.max_retries + 1):
+            self.bucket.acquire()
+            try:
+                response = self.session.get(url, params=params, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(0.5 * 2 ** attempt)
+                continue
+
+            if response.status_code == 429 and attempt < self.max_retries:
+                time.sleep(parse_retry_after(response.headers.get("Retry-After")))
+                continue
+            if response.status_code >= 500 and attempt < self.max_retries:
+                time.sleep(0.5 * 2 ** attempt)
+                continue
+            return response
+        return response
+
+    def fetch_trailer_url(self, imdb_id):
+        """Fetch the trailer URL for one movie; returns None when TMDb has no trailer, raises on errors."""
+        if self.id_index is not None:
+            return self.fetch_trailer_url_by_tmdb_id(self.id_index.get(imdb_id))
+        response = self._get(f"/movie/{imdb_id}/videos", {"language": "en-US"})
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return pick_trailer_url(response.json())
+
+    def fetch_trailer_url_by_tmdb_id(self, tmdb_id):
+        """Fetch a movie's details and videos in one call and return its trailer URL, or None."""
+        response = self._get(f"/movie/{tmdb_id}", {"language": "en-US", "append_to_response": "videos"})
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return pick_trailer_url(response.json().get("videos", {}))
+
+    def get_trailer_url(self, imdb_id):
+        """Fetch the trailer URL using TMDb API, answering from the cache when possible."""
+        # Not cached: a newer export may map the movie later
+        if self.id_index is not None and imdb_id not in self.id_index:
+            metrics.count("tmdb_lookup", "not in ID index")
+            print(f"No TMDb ID for IMDb ID: {imdb_id}")
+            return None
+        if self.cache is not None:
+            hit, trailer_url = self.cache.get(imdb_id)
+            if hit:
+                metrics.count("tmdb_lookup", "cache hit")
+                return trailer_url
+
+        start = time.perf_counter()
+        ok = False
+        try:
+            trailer_url = self.fetch_trailer_url(imdb_id)
+            ok = True
+        except Exception as e:
+            # Errors are not cached so the movie is retried on the next run
+            print(f"Error fetching trailer for IMDb ID {imdb_id}: {e}")
+            metrics.count("tmdb_lookup", "error")
+            return None
+        finally:
+            seconds = time.perf_counter() - start
+            metrics.observe("tmdb_lookup", seconds, ok=ok)
+            with self.stats_lock:
+                self.fetch_count += 1
+                self.fetch_seconds += seconds
+        metrics.count("tmdb_lookup", "trailer" if trailer_url else "no trailer")
+
+        if trailer_url:
+            print(trailer_url)
+        else:
+            print(f"No trailer found for IMDb ID: {imdb_id}")
+        if self.cache is not None:
+            self.cache.put(imdb_id, trailer_url)
+        return trailer_url
+
+    def get_trailer_urls(self, imdb_ids):
+        """Look up trailers for many movies concurrently; returns {imdb_id: trailer_url or None}."""
+        imdb_ids = list(dict.fromkeys(imdb_ids))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return dict(zip(imdb_ids, pool.map(self.get_trailer_url, imdb_ids)))
+
+    def cache_report(self):
+        """Summarize cache hits/misses and the TMDb time the hits saved."""
+        if self.cache is None:
+            return "Trailer cache disabled"
+        stats = self.cache.stats()
+        avg_fetch = self.fetch_seconds / self.fetch_count if self.fetch_count else 0.0
+        return (f"Trailer cache: {stats['hits']} hits, {stats['misses']} misses "
+                f"({stats['hit_rate']:.0%} hit rate), ~{stats['hits'] * avg_fetch:.1f}s of TMDb requests saved")
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
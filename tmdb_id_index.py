@@ -0,0 +1,102 @@
+"""
+Local IMDb -> TMDb movie ID index.
+
+Built once from a TMDb ID export file: JSON lines (optionally .gz), one movie
+per line, e.g. {"id": 278, "imdb_id": "tt0111161", "original_title": ...}.
+TMDb's daily movie_ids export lists TMDb IDs only, so the file needs an
+"imdb_id" on each line (lines without one are skipped), e.g. the export
+joined with /movie/{id}/external_ids once.
+
+The index is two parallel uint32 arrays sorted by the numeric part of the
+IMDb ID, saved as .npy and memory-mapped on load, so a lookup is one binary
+search and nothing is parsed at startup.
+
+    python tmdb_id_index.py movie_ids_with_imdb.json.gz tmdb_id_index
+"""
+import os
+import re
+import gzip
+import json
+import argparse
+import numpy as np
+
+IMDB_NUMBER_RE = re.compile(r'^tt(\d+)$')
+IMDB_FILE = "imdb.npy"
+TMDB_FILE = "tmdb.npy"
+
+
+def imdb_number(imdb_id):
+    """Numeric part of an IMDb title ID ('tt0111161' -> 111161), or None."""
+    match = IMDB_NUMBER_RE.match(imdb_id or "")
+    return int(match.group(1)) if match else None
+
+def read_export(path):
+    """Yield (imdb number, tmdb id) from a JSON-lines TMDb ID export."""
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            number = imdb_number(entry.get("imdb_id"))
+            if number is not None and entry.get("id"):
+                yield number, int(entry["id"])
+
+
+class TMDbIdIndex:
+    """Sorted-array IMDb -> TMDb ID lookup (see the module docstring)."""
+
+    def __init__(self, imdb_numbers, tmdb_ids):
+        self.imdb_numbers = imdb_numbers
+        self.tmdb_ids = tmdb_ids
+
+    @classmethod
+    def from_export(cls, path):
+        pairs = np.array(list(read_export(path)), dtype=np.uint32).reshape(-1, 2)
+        order = np.argsort(pairs[:, 0], kind="stable")
+        pairs = pairs[order]
+        # Keep one TMDb ID per IMDb ID (the first listed)
+        keep = np.ones(len(pairs), dtype=bool)
+        keep[1:] = pairs[1:, 0] != pairs[:-1, 0]
+        return cls(np.ascontiguousarray(pairs[keep, 0]), np.ascontiguousarray(pairs[keep, 1]))
+
+    @classmethod
+    def load(cls, path):
+        return cls(np.load(os.path.join(path, IMDB_FILE), mmap_mode="r"),
+                   np.load(os.path.join(path, TMDB_FILE), mmap_mode="r"))
+
+    def save(self, path):
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, IMDB_FILE), self.imdb_numbers)
+        np.save(os.path.join(path, TMDB_FILE), self.tmdb_ids)
+
+    def __len__(self):
+        return len(self.imdb_numbers)
+
+    def get(self, imdb_id):
+        """TMDb movie ID for an IMDb ID, or None if the export doesn't list it."""
+        number = imdb_number(imdb_id)
+        if number is None or number > np.iinfo(np.uint32).max:
+            return None
+        i = int(np.searchsorted(self.imdb_numbers, number))
+        if i < len(self.imdb_numbers) and self.imdb_numbers[i] == number:
+            return int(self.tmdb_ids[i])
+        return None
+
+    def __contains__(self, imdb_id):
+        return self.get(imdb_id) is not None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("export")
+    parser.add_argument("out_dir")
+    args = parser.parse_args()
+    index = TMDbIdIndex.from_export(args.export)
+    index.save(args.out_dir)
+    print(f"Indexed {len(index)} IMDb IDs into {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import time
+import sqlite3
+import threading
+
+DAY = 24 * 60 * 60
+
+
+class TrailerCache:
+    """
+    On-disk cache of TMDb trailer lookups keyed by IMDb ID.
+
+    Stores the chosen trailer URL, or NULL for "no trailer", with the time it
+    was fetched. Entries older than `ttl` seconds (`negative_ttl` for "no
+    trailer" entries) count as misses so they get looked up again.
+    """
+
+    def __init__(self, path="trailer_cache.sqlite", ttl=30 * DAY, negative_ttl=None):
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = ttl if negative_ttl is None else negative_ttl
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS trailers ("
+            "imdb_id TEXT PRIMARY KEY, trailer_url TEXT, fetched_at REAL NOT NULL)"
+        )
+        self.conn.commit()
+
+    def get(self, imdb_id):
+        """Return (hit, trailer_url); trailer_url is None for a cached "no trailer" result."""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT trailer_url, fetched_at FROM trailers WHERE imdb_id = ?", (imdb_id,)
+            ).fetchone()
+            if row is not None:
+                trailer_url, fetched_at = row
+                ttl = self.ttl if trailer_url else self.negative_ttl
+                if time.time() - fetched_at < ttl:
+                    self.hits += 1
+                    return True, trailer_url
+            self.misses += 1
+            return False, None
+
+    def put(self, imdb_id, trailer_url):
+        """Store a lookup result; pass None to record that the movie has no trailer."""
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO trailers (imdb_id, trailer_url, fetched_at) VALUES (?, ?, ?)",
+                (imdb_id, trailer_url, time.time()),
+            )
+            self.conn.commit()
+
+    def stats(self):
+        """Return hit/miss counters for this session."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def close(self):
+        self.conn.close()
@@ -1,15 +1,20 @@
 from dotenv import load_dotenv
-import time
-import ast
-import re
 import os
-import requests
-import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import yt_dlp
+from types import SimpleNamespace
+from browser_pool import BrowserPool
+from tmdb_client import TMDbClient, TMDB_API_BASE
+from trailer_cache import TrailerCache, DAY
+from tmdb_id_index import TMDbIdIndex
+from media_pipeline import build_media_pipeline
+from media_store import MediaStore, AUDIO, POSTER
+from poster_fetcher import PosterFetcher
+from dataset_shards import export_shards
+from run_metrics import metrics
+from crawl_journal import CrawlJournal, COMMITTED, DROPPED
+from dataset_io import save_dataset
+from genre_bits import genre_bit, export_multi_hot
+from movie_store import MovieStore
+from seen_ids import SeenIds
 
 ### this version downoads the trailer audios and movie posters, and avoids duplicates
 
@@ -23,6 +28,19 @@ TMDB_API_TOKEN = "REDACTED"
 
 # number of times to click "Show 50 more"
 range_movies = 20
+# seconds to wait for a click to load new results before giving up on the genre
+pagination_timeout = 10
+
+# number of Chrome workers crawling genres in parallel, and how many pages each
+# browser loads before it is replaced (caps chromedriver memory growth)
+browser_workers = 1
+pages_per_driver = 10
+headless = False
+# split each genre's release-date range into this many shards spread across the workers
+date_shards = 1
+# delta crawl for scheduled refreshes: sort newest-first and stop clicking "show more" once a
+# whole batch is already in the dataset with that genre (range_movies stays the upper bound)
+delta_crawl = False
 
 # genres = {
 #     0: "action", 1: "adventure", 2: "animation", 3: "biography", 4: "comedy",
@@ -36,326 +54,267 @@ genres = {
     5: "crime"
 }
 
-# Path to existing CSV file
-existing_csv_path = "IMDb_Genres_Data.csv"
+# Path to existing dataset (.csv, or a .parquet file/directory);
+# None reloads the dataset this script saves for these genres and output_format
+existing_data_path = None
+
+# "csv" or "parquet"; Parquet keeps Genre as a native list column and numeric columns typed
+output_format = "csv"
+# optional Parquet partition columns, e.g. ["IMDb Score"]
+parquet_partition_cols = None
+# also write genres as an (N x 26) uint8 multi-hot matrix aligned with the IMDb IDs
+export_genre_matrix = True
+
+# "page_source" parses one HTML snapshot per genre in-process,
+# "elements" queries every result card through WebDriver,
+# "network" builds records from the page's JSON and captured GraphQL responses
+# (and blocks images, fonts and ad/tracker requests),
+# "stream" parses and removes new cards after every click, keeping browser memory
+# flat on very long result lists, and prints peak memory per genre
+extraction_mode = "page_source"
+
+# number of concurrent TMDb trailer lookups
+tmdb_workers = 8
+# optional local IMDb -> TMDb ID index (built with tmdb_id_index.py from a TMDb ID export);
+# movies are then fetched with one details+videos call, and ones it doesn't list are skipped
+tmdb_id_index_path = None
+
+# on-disk cache of trailer lookups; "no trailer" results are cached too
+trailer_cache_path = "trailer_cache.sqlite"
+trailer_cache_ttl_days = 30
+
+# worker threads per media pipeline stage and the size of the queues between them
+pipeline_workers = {"lookup": tmdb_workers, "download": 4, "transcode": 2, "poster": 4}
+pipeline_queue_size = 16
+
+# content-addressed store of audio and posters shared by every data_<genres> folder;
+# movies already fetched by any earlier crawl are hard-linked instead of downloaded (None disables)
+media_store_path = "media_store"
+
+# posters are requested at most this wide from IMDb's image server (smaller thumbnails as they are);
+# ETag/Last-Modified are kept so unchanged posters are not downloaded again on later runs
+poster_width = 300
+poster_validators_path = "poster_validators.sqlite"
+
+# also pack the saved rows' posters (uint8 arrays, memory-mapped) and opus audio into
+# fixed-size shards with an IMDb ID index, under shards/, for training loaders
+export_training_shards = False
+shard_size = 1024
+shard_poster_shape = (300, 200)
+
+# also sample deduplicated trailer frames (as in ver1.py) from the same single trailer download,
+# saved under frames/<IMDb ID>/; hash grid size and how many recent frames a sample must differ from
+sample_trailer_frames = False
+frame_hash_size = 3
+frame_buffer_size = 20
+
+# folder the data_<genres> folders and a relative media_store_path are created in
+data_root = os.path.dirname(os.path.abspath(__file__))
+# TMDb API endpoint (the offline benchmark points this at a local stub)
+tmdb_base_url = TMDB_API_BASE
 
 ######################################################
 # END
 ######################################################
 
-
-# Load existing DataFrame or create a new one if file doesn't exist
-if os.path.exists(existing_csv_path):
-    existing_df = pd.read_csv(existing_csv_path)
-else:
-    existing_df = pd.DataFrame(columns=["Genre", "Title", "Runtime (min)", "IMDb Score", "Votes", "IMDb ID", "Poster URL"])
-
-def parse_runtime(runtime_str):
-    """Convert '1h 40m' format to total minutes"""
-    hours = re.findall(r'(\d+)h', runtime_str)
-    minutes = re.findall(r'(\d+)m', runtime_str)
-    total_minutes = 0
-    if hours:
-        total_minutes += int(hours[0]) * 60
-    if minutes:
-        total_minutes += int(minutes[0])
-    return int(total_minutes) if total_minutes > 0 else None
-
-def parse_votes(votes_str):
-    """Convert vote strings like '1.9M', '24K' to numeric values"""
-    if not votes_str or not isinstance(votes_str, str):
-        return None
-    
-    votes_str = re.sub(r'[(),\s]', '', votes_str)
-    
-    try:
-        if votes_str.endswith('K'):
-            return int(float(votes_str[:-1]) * 1000)
-        elif votes_str.endswith('M'):
-            return int(float(votes_str[:-1]) * 1000000)
-        else:
-            return int(votes_str)
-    except ValueError:
-        return None
-
-def parse_imdb_score(score_str):
-    """Ensure IMDb score is numeric or set it to None"""
-    try:
-        return float(score_str) if score_str and score_str.replace('.', '', 1).isdigit() else None
-    except ValueError:
-        return None
-
-def get_imdb_id(element):
-    """Extract IMDb ID from the movie element."""
-    try:
-        link = element.find_element(By.TAG_NAME, 'a').get_attribute('href')
-        imdb_id = re.search(r'/title/(tt\d+)/', link).group(1) if link else None
-        return str(imdb_id)
-    except Exception as e:
-        print(f"Error extracting IMDb ID: {e}")
-        return None
-
-def get_movie_poster(element):
-    """Extract and download movie poster."""
-    try:
-        img_element = element.find_element(By.XPATH, './/div[contains(@class, "ipc-media")]/img')
-        poster_url = img_element.get_attribute('src')
-        return poster_url
-    except Exception as e:
-        print(f"Error extracting poster URL: {e}")
-        return None
-
-def download_audio(trailer_url, output_dir, imdb_id):
-    """Download trailer audio with yt-dlp using minimal storage/time"""
-    try:
-        os.makedirs(output_dir, exist_ok=True)
-        
-        options = {
-            'format': 'worstaudio[ext=webm]/worstaudio/worst', 
-            'outtmpl': os.path.join(output_dir, f"{imdb_id}"),
-            'quiet': True,
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'opus',  # More efficient than MP3
-                'preferredquality': '0',   # Lowest quality setting
-            }],
-            'postprocessor_args': ['-metadata', 'comment='],  # Strip metadata
-            'writemetadata': False,        # Disable metadata file
-            'audio-quality': '32K',        # Explicit low bitrate
-            'writethumbnail': False,       # No cover art
-            'noprogress': True,            # Reduces output processing
-            'external_downloader': 'aria2c',  # Faster downloads
-            'external_downloader_args': ['-x16', '-s16', '-j16']
-        }
-        
-        with yt_dlp.YoutubeDL(options) as ydl:
-            ydl.download([trailer_url])
-            
-    except Exception as e:
-        print(f"Error downloading audio for {imdb_id}: {e}")
-
-
-def get_trailer_url(imdb_id):
-    """Fetch the trailer URL using TMDb API."""
-    try:
-        url = f"https://api.themoviedb.org/3/movie/{imdb_id}/videos?language=en-US"
-        headers = {
-            "accept": "application/json",
-            "Authorization": TMDB_API_TOKEN,
-        }
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Filter for trailers only
-        for video in data.get("results", []):
-            if video["type"] == "Trailer" and video["site"] == "YouTube":
-                trailer_url = f"https://www.youtube.com/watch?v={video['key']}"
-                print(trailer_url)
-                return trailer_url
-        
-        print(f"No trailer found for IMDb ID: {imdb_id}")
-        return None
-    except Exception as e:
-        print(f"Error fetching trailer for IMDb ID {imdb_id}: {e}")
-        return None
-
-
-
-    
-load_dotenv()
-
-    
-    # Initialize the WebDriver
-driver = webdriver.Chrome()
-
-
-all_data_dict = {}  # Dictionary to store unique movies by IMDb ID
-existing_dict = existing_df.to_dict(orient="index")
-formatted_dict = {}
-for idx, row in existing_dict.items():
-    imdb_id = row["IMDb ID"]  # Use IMDb ID as the key
-    formatted_dict[imdb_id] = {
-        "Genre": ast.literal_eval(row["Genre"]) if isinstance(row["Genre"], str) else row["Genre"],
-        "Title": row["Title"],
-        "Runtime (min)": row["Runtime (min)"],
-        "IMDb Score": row["IMDb Score"],
-        "Votes": row["Votes"],
-        "IMDb ID": imdb_id,
-        "Poster URL": row["Poster URL"],
-    }
-existing_dict = formatted_dict
-exist_count = 0
-for index, genre in genres.items():
-    url = f"https://www.imdb.com/search/title/?title_type=feature&genres={genre}&release_date=2000-01-01,2025-12-31"
-    driver.get(url)
-
-    # Maximize window and wait for page load
-    driver.maximize_window()
-    time.sleep(3)
-    for i in range(range_movies):
-        try:
-            buttons = WebDriverWait(driver, 10).until(
-                EC.presence_of_all_elements_located((By.XPATH, "//span[contains(text(), ' more')]"))
-            )
-
-            for button in buttons:
-                text = button.text
-                if re.search(r'\d+', text):
-                    driver.execute_script("arguments[0].click();", button)
-                    break
-
-            time.sleep(1)
-        except Exception:
-            break
-
-    elements = driver.find_elements(By.XPATH, '//*[@id="__next"]/main/div[2]/div[3]/section/section/div/section/section/div[2]/div/section/div[2]/div[2]/ul/li')
-
-    for index, element in enumerate(elements, start=1):
-        text = element.text.strip()
-        lines = text.split("\n") 
-
-        title = lines[0].split('. ', 1)[-1] if lines and '. ' in lines[0] else lines[0] if lines else None
-        runtime = lines[2] if len(lines) > 2 else None
-        imdb_score = lines[4] if len(lines) > 4 else None
-        votes = lines[5] if len(lines) > 5 else None
-
-        imdb_id = get_imdb_id(element)
-        poster_url = get_movie_poster(element)
-
-        if imdb_id in existing_dict:
-            exist_count+= 1
-            # Update genres for existing movie
-            existing_genres = existing_dict[imdb_id]["Genre"]
-            cur_genre = [key for key, value in genres.items() if value == genre]
-            for g in cur_genre:
-                if g not in existing_dict[imdb_id]["Genre"]:
-                    existing_dict[imdb_id]["Genre"].append(g)
-                
+# Names of the settings above; run() takes them as a dict
+CONFIG_NAMES = [
+    "TMDB_API_TOKEN", "range_movies", "pagination_timeout", "browser_workers", "pages_per_driver", "headless",
+    "date_shards", "delta_crawl", "genres", "existing_data_path", "output_format", "parquet_partition_cols",
+    "export_genre_matrix", "extraction_mode", "tmdb_workers", "tmdb_id_index_path", "trailer_cache_path",
+    "trailer_cache_ttl_days", "pipeline_workers", "pipeline_queue_size", "media_store_path", "poster_width",
+    "poster_validators_path", "export_training_shards", "shard_size", "shard_poster_shape",
+    "sample_trailer_frames", "frame_hash_size", "frame_buffer_size", "data_root", "tmdb_base_url",
+]
+
+
+def default_config():
+    """The settings above as a dict, the form run() takes."""
+    return {name: globals()[name] for name in CONFIG_NAMES}
+
+
+def run(config):
+    """
+    Crawl the configured genres, fetch trailer audio and posters for new movies and save the dataset.
+
+    `config` maps every name in CONFIG_NAMES to its value (see default_config()).
+    Returns the number of movies scraped, new and saved, and the dataset's rows.
+    """
+    c = SimpleNamespace(**config)
+    load_dotenv()
+    metrics.reset()
+
+    # Create main data directory
+    folder_name = "data_" + "_".join(list(c.genres.values()))
+    data_dir = os.path.join(c.data_root, folder_name)
+    os.makedirs(data_dir, exist_ok=True)
+    data_path = os.path.join(data_dir, "IMDb_Genres_Data." + ("parquet" if c.output_format == "parquet" else "csv"))
+
+    # Load existing movies, indexed by IMDb ID (empty if the file doesn't exist)
+    existing = MovieStore.load(c.existing_data_path or data_path)
+
+    # Per-stage timings, outcomes and bytes of this run as JSON lines; summarized at the end
+    metrics.open(os.path.join(data_dir, "metrics.jsonl"))
+
+    # Journal of this crawl's progress; an interrupted run picks up where it stopped
+    journal = CrawlJournal(os.path.join(data_dir, "crawl_journal.jsonl"))
+
+    # Movies from every genre crawl; a movie found in several genres gets all of their bits
+    scraped = MovieStore()
+    for index, genre in c.genres.items():
+        if genre in journal.genres_done:
+            print(f"Resuming: {genre} already scraped, using journaled results")
+            scraped.add_cards(journal.cards_by_genre[genre], genre_bit(index))
+
+    # Crawl the remaining genres (or date-range shards of them) across a pool of browsers
+    pending_genres = {index: genre for index, genre in c.genres.items() if genre not in journal.genres_done}
+    if pending_genres:
+        # Every title the crawls feeding this folder's dataset returned, per genre
+        seen_ids = SeenIds(os.path.join(data_dir, "seen_ids.sqlite"))
+        known_ids = None
+        if c.delta_crawl:
+            known_ids = {}
+            for index in pending_genres:
+                saved = {record.imdb_id for record in existing if record.genre_mask & genre_bit(index)}
+                # Titles that were crawled but dropped count as known too, as long as the dataset
+                # still has the genre; without it (new or deleted dataset) the genre is crawled in full
+                known_ids[index] = saved | seen_ids.ids(index) if saved else set()
+        pool = BrowserPool(c.browser_workers, c.pages_per_driver, c.headless, c.range_movies, c.pagination_timeout,
+                           c.extraction_mode, known_ids)
+        with metrics.timer("crawl"):
+            for index, genre, cards, complete in pool.crawl_genres(pending_genres, shards=c.date_shards):
+                if complete:
+                    journal.record_genre(genre, cards)
+                else:
+                    print(f"Some {genre} pages failed; it will be crawled again on the next run")
+                seen_ids.add(index, (card["IMDb ID"] for card in cards if card["IMDb ID"]))
+                scraped.add_cards(cards, genre_bit(index))
+        seen_ids.close()
+
+    # Update genres for existing movies; the rest are new
+    new_movies = MovieStore()
+    exist_count = 0
+    for record in scraped:
+        if existing.merge_genres(record.imdb_id, record.genre_mask):
+            exist_count += 1
         else:
-            # Add new movie entry
-            all_data_dict[imdb_id] = {
-                "Genre": [key for key, value in genres.items() if value == genre],
-                "Title": title,
-                "Runtime (min)": parse_runtime(runtime) if runtime else None,
-                "IMDb Score": parse_imdb_score(imdb_score),
-                "Votes": parse_votes(votes),
-                "IMDb ID": imdb_id,
-                "Poster URL": poster_url,
-            }
-print("EXIST COUNT", exist_count)
-existing_df = pd.DataFrame.from_dict(existing_dict, orient="index")
-
-# Convert dictionary to DataFrame
-new_data_df = pd.DataFrame(all_data_dict.values())
-
-# Create main data directory
-folder_name = "data_" + "_".join(list(genres.values()))
-data_dir = os.path.join(os.path.dirname(__file__), folder_name)
-os.makedirs(data_dir, exist_ok=True)
-
-# Define subdirectories
-audio_dir = os.path.join(data_dir, "audios")
-poster_dir = os.path.join(data_dir, "posters")
-os.makedirs(audio_dir, exist_ok=True)
-os.makedirs(poster_dir, exist_ok=True)
-
-# List to store valid rows
-valid_rows = []
-
-# Process each row to validate and download resources
-for idx, row in new_data_df.iterrows():
-    imdb_id = row["IMDb ID"]
-    
-    # Check if files already exist for this movie
-    audio_file = os.path.join(audio_dir, f"{imdb_id}.opus")
-    poster_file = os.path.join(poster_dir, f"{imdb_id}.jpg")
-    files_exist = os.path.exists(audio_file) and os.path.exists(poster_file)
-    
-    # If files already exist, consider it valid and continue
-    if files_exist:
-        print(f"Files already exist for {imdb_id}, adding to valid rows")
-        valid_rows.append(row)
-        continue
-    
-    # Skip if no poster URL
-    if pd.isna(row["Poster URL"]):
-        print(f"Skipping {imdb_id}: No poster URL available")
-        continue
-    
-    # Check for trailer availability first without downloading
-    trailer_url = get_trailer_url(imdb_id)
-    if not trailer_url:
-        print(f"Skipping {imdb_id}: No trailer available")
-        continue
-    
-    # Validate poster URL is accessible
-    poster_url = row["Poster URL"]
-    try:
-        response = requests.head(poster_url)
-        response.raise_for_status()
-    except Exception as e:
-        print(f"Skipping {imdb_id}: Poster URL not accessible - {e}")
-        continue
-    
-    # Download resources
-    download_success = True
-    try:
-        # Download trailer audio
-        download_audio(trailer_url, audio_dir, imdb_id)
-        
-        # Verify audio file was created
-        if not os.path.exists(audio_file):
-            print(f"Audio download failed for {imdb_id} - file not found")
-            download_success = False
-    except Exception as e:
-        print(f"Error downloading audio for {imdb_id}: {e}")
-        download_success = False
-    
-    if not download_success:
-        # Clean up any existing files
-        if os.path.exists(audio_file):
-            os.remove(audio_file)
-        continue
-    
-    # Now download poster
-    try:
-        response = requests.get(poster_url)
-        response.raise_for_status()
-        with open(poster_file, 'wb') as f:
-            f.write(response.content)
-        print(f"Poster saved: {imdb_id}.jpg")
-    except Exception as e:
-        print(f"Poster download failed for {imdb_id}: {e}")
-        # Clean up audio file since poster failed
-        if os.path.exists(audio_file):
-            os.remove(audio_file)
-        continue
-    
-    # All resources downloaded successfully, add to valid rows
-    valid_rows.append(row)
-
-valid_df = pd.DataFrame(valid_rows) if valid_rows else pd.DataFrame(columns=new_data_df.columns)
-
-valid_df.dropna(axis = 0, how = 'all', inplace = True)
-valid_df.dropna(subset=["Poster URL"], inplace=True)
-existing_df.dropna(axis = 0, how = 'all', inplace = True)
-existing_df.dropna(subset=["Poster URL"], inplace=True)
-
-
-df = pd.concat([existing_df, valid_df])
-                       
-# Drop movies without a poster or trailer audio
-df.reset_index(drop=True, inplace=True)
-
-# Save the valid DataFrame
-csv_path = os.path.join(data_dir, "IMDb_Genres_Data.csv")
-if not df.empty:
-    df.to_csv(csv_path, index=False, encoding="utf-8")
-    print(f"Data saved successfully to {csv_path}! Total df rows: {len(df)}, Total new rows: {len(valid_df)}")
-else:
-    print("No valid rows found. CSV not created.")
-
-
-driver.quit()
+            new_movies.add(record)
+    print("EXIST COUNT", exist_count)
+    metrics.count("dedupe", "existing", exist_count)
+    metrics.count("dedupe", "new", len(new_movies))
+
+    # Define subdirectories
+    audio_dir = os.path.join(data_dir, "audios")
+    poster_dir = os.path.join(data_dir, "posters")
+    os.makedirs(audio_dir, exist_ok=True)
+    os.makedirs(poster_dir, exist_ok=True)
+    frame_dir = os.path.join(data_dir, "frames") if c.sample_trailer_frames else None
+    media_store = MediaStore(os.path.join(c.data_root, c.media_store_path)) if c.media_store_path else None
+
+    # New movies that have both their audio and poster
+    valid_records = []
+    # Movies that still need their trailer audio and poster
+    jobs = []
+
+    for record in new_movies:
+        imdb_id = record.imdb_id
+
+        # Movies an interrupted run already finished with
+        if journal.state(imdb_id) == COMMITTED:
+            valid_records.append(record)
+            continue
+        if journal.state(imdb_id) == DROPPED:
+            continue
+
+        # Check if files already exist for this movie
+        audio_file = os.path.join(audio_dir, f"{imdb_id}.opus")
+        poster_file = os.path.join(poster_dir, f"{imdb_id}.jpg")
+        files_exist = os.path.exists(audio_file) and os.path.exists(poster_file) and \
+            (frame_dir is None or os.path.isdir(os.path.join(frame_dir, imdb_id)))
+
+        # If files already exist, consider it valid and continue
+        if files_exist:
+            print(f"Files already exist for {imdb_id}, adding to valid rows")
+            valid_records.append(record)
+            continue
+
+        # Audio and poster fetched by another crawl: link them into this folder
+        if media_store is not None and frame_dir is None and \
+                media_store.lookup(imdb_id, AUDIO) and media_store.lookup(imdb_id, POSTER):
+            media_store.link(imdb_id, AUDIO, audio_file)
+            media_store.link(imdb_id, POSTER, poster_file)
+            journal.record(COMMITTED, imdb_id)
+            print(f"Media for {imdb_id} linked from the media store")
+            valid_records.append(record)
+            continue
+
+        # Skip if no poster URL
+        if record.poster_url is None:
+            print(f"Skipping {imdb_id}: No poster URL available")
+            continue
+
+        jobs.append({"imdb_id": imdb_id, "poster_url": record.poster_url, "record": record})
+
+    # Look up trailers and download audio and posters in overlapping stages;
+    # only movies with both audio and poster come out of the pipeline
+    trailer_cache = TrailerCache(c.trailer_cache_path, ttl=c.trailer_cache_ttl_days * DAY)
+    id_index = TMDbIdIndex.load(c.tmdb_id_index_path) if c.tmdb_id_index_path else None
+    poster_fetcher = PosterFetcher(c.poster_validators_path, width=c.poster_width,
+                                   max_workers=c.pipeline_workers["poster"])
+    with TMDbClient(c.TMDB_API_TOKEN, base_url=c.tmdb_base_url, max_workers=c.tmdb_workers, cache=trailer_cache,
+                    id_index=id_index) as tmdb_client, poster_fetcher:
+        pipeline = build_media_pipeline(tmdb_client, audio_dir, poster_dir, c.pipeline_workers,
+                                        c.pipeline_queue_size, journal=journal, frame_dir=frame_dir,
+                                        hash_size=c.frame_hash_size, buffer_size=c.frame_buffer_size,
+                                        media_store=media_store, poster_fetcher=poster_fetcher)
+        for job in pipeline.run(jobs):
+            journal.record(COMMITTED, job["imdb_id"])
+            metrics.count("pipeline", "committed")
+            valid_records.append(job["record"])
+        print(pipeline.report())
+        print(tmdb_client.cache_report())
+        print(poster_fetcher.report())
+    trailer_cache.close()
+
+    for record in valid_records:
+        existing.add(record)
+
+    # Drop movies without a poster
+    df = existing.to_frame().dropna(subset=["Poster URL"]).reset_index(drop=True)
+
+    def media_paths(imdb_id):
+        """Audio and poster paths of a movie; rows from earlier crawls may only have them in the media store."""
+        audio_file = os.path.join(audio_dir, f"{imdb_id}.opus")
+        poster_file = os.path.join(poster_dir, f"{imdb_id}.jpg")
+        if media_store is not None:
+            audio_file = audio_file if os.path.exists(audio_file) else media_store.lookup(imdb_id, AUDIO)
+            poster_file = poster_file if os.path.exists(poster_file) else media_store.lookup(imdb_id, POSTER)
+        return audio_file, poster_file
+
+    # Save the valid DataFrame
+    if not df.empty:
+        save_dataset(df, data_path, c.parquet_partition_cols)
+        if c.export_genre_matrix:
+            export_multi_hot(df, os.path.join(data_dir, "genres_multi_hot.npz"))
+        if c.export_training_shards:
+            export_shards(df["IMDb ID"].tolist(), media_paths, os.path.join(data_dir, "shards"), c.shard_size,
+                          c.shard_poster_shape)
+        print(f"Data saved successfully to {data_path}! Total df rows: {len(df)}, "
+              f"Total new rows: {len(valid_records)}")
+    else:
+        print("No valid rows found. Dataset not created.")
+
+    if media_store is not None:
+        print(media_store.report())
+        media_store.close()
+
+    print(metrics.report())
+    metrics.close()
+
+    # The run's output is saved, so the next run starts a fresh journal
+    journal.finish()
+    return {"scraped": len(scraped), "new": len(new_movies), "saved": len(valid_records), "rows": len(df)}
+
+
+if __name__ == "__main__":
+    run(default_config())